@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import subprocess
+from collections import deque
 from pathlib import Path
+from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.prompt import Prompt, Confirm
+from rich.markup import escape
 
 console = Console()
 
@@ -17,17 +19,24 @@ def add_cmd(
     name: str = typer.Option(None, "--name", "-n", help="Logical name for the repo (defaults to repo name)."),
     description: str = typer.Option(None, "--desc", "-d", help="Short description of the repo."),
     infrastructure: bool = typer.Option(False, "--infrastructure", "--infra", "-i", help="Mark as infrastructure-only (never started)."),
+    depth: Optional[int] = typer.Option(None, "--depth", help="Shallow clone with only the last N commits."),
+    blobless: bool = typer.Option(False, "--blobless", help="Partial clone that fetches file contents on demand."),
+    interactive: bool = typer.Option(False, "--interactive", help="Prompt for missing fields even when a URL is given."),
 ) -> None:
     """Add a new repo to the workbench."""
+    from rich.prompt import Prompt, Confirm
+
     from cli.main import banner, state
-    from cli.utils.config import load_config, save_config, find_workbench_yaml, RepoConfig
+    from cli.utils.config import get_workbench_context, save_config, RepoConfig
 
     banner()
 
-    config = load_config()
-    workbench_root = find_workbench_yaml().parent
+    config, workbench_root = get_workbench_context()
+
+    # Prompt for missing values only when run bare (or asked to); with a URL
+    # on the command line everything else falls back to its default.
+    prompt = interactive or not url
 
-    # Interactive prompts for missing values
     if not url:
         url = Prompt.ask("  [bold]Git URL[/bold]")
         if not url:
@@ -37,18 +46,22 @@ def add_cmd(
     # Derive name from URL if not provided
     if not name:
         default_name = url.rstrip("/").split("/")[-1].replace(".git", "")
-        name = Prompt.ask("  [bold]Name[/bold]", default=default_name)
+        name = Prompt.ask("  [bold]Name[/bold]", default=default_name) if prompt else default_name
 
     if name in config.repos:
         console.print(f"  [red]✗[/red] Repo [bold]{name}[/bold] already exists in workbench.yaml.\n")
         raise typer.Exit(1)
 
-    if not description:
-        description = Prompt.ask("  [bold]Description[/bold]", default="")
+    if description is None:
+        description = Prompt.ask("  [bold]Description[/bold]", default="") if prompt else ""
 
-    if not infrastructure:
+    if not infrastructure and prompt:
         infrastructure = Confirm.ask("  [bold]Infrastructure only?[/bold] (reference repo, never started)", default=False)
 
+    if not prompt:
+        kind = "infrastructure" if infrastructure else "service"
+        console.print(f"  [dim]Adding[/dim] [bold]{name}[/bold] [dim]({kind}) from {url}[/dim]")
+
     # Determine path
     repo_dir_name = url.rstrip("/").split("/")[-1].replace(".git", "")
     repo_path = f"repos/{repo_dir_name}"
@@ -61,13 +74,26 @@ def add_cmd(
         console.print(f"  [yellow]○[/yellow] {name:20s} already cloned → {repo_path}")
     else:
         console.print(f"  [dim]…[/dim] {name:20s} cloning...")
-        result = subprocess.run(
-            ["git", "clone", url, str(abs_repo_path)],
-            capture_output=True, text=True,
-        )
-        if result.returncode != 0:
+        clone_args = ["git", "clone", "--progress"]
+        if depth:
+            clone_args += ["--depth", str(depth)]
+        if blobless:
+            clone_args.append("--filter=blob:none")
+        clone_args += [url, str(abs_repo_path)]
+
+        # Stream git's progress as it arrives; keep only the tail for error reporting
+        proc = subprocess.Popen(clone_args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        tail: deque[str] = deque(maxlen=5)
+        with console.status(f"[dim]{name:20s} cloning...[/dim]") as progress:
+            for line in proc.stderr:
+                line = line.strip()
+                if line:
+                    tail.append(line)
+                    progress.update(f"[dim]{name:20s} {escape(line)}[/dim]")
+        if proc.wait() != 0:
+            detail = escape("\n".join(tail))
             console.print(f"  [red]✗[/red] {name:20s} clone failed")
-            console.print(f"    [dim]{result.stderr.strip()}[/dim]\n")
+            console.print(f"    [dim]{detail}[/dim]\n")
             raise typer.Exit(1)
         console.print(f"  [green]✓[/green] {name:20s} cloned → {repo_path}")
 
@@ -88,10 +114,9 @@ def add_cmd(
     console.print("  [bold]→[/bold] Running discovery...")
 
     try:
-        from cli.commands.discover import _discover_repo, _merge_discovered
-        repo_path = workbench_root / repo.path
-        log: dict[str, str] = {}
-        discovered = _discover_repo(repo_path, repo, log)
+        from cli.commands.discover import _discover_repo_cached, _merge_discovered
+        # Goes through discover's cache, so a follow-up `workbench discover` reuses this result
+        discovered, _ = _discover_repo_cached(str(workbench_root / repo.path), repo)
         _merge_discovered(repo, discovered)
         save_config(config)
 
@@ -8,8 +8,6 @@ from typing import Optional
 
 import typer
 
-from cli.utils.config import load_config, find_workbench_yaml
-
 
 def cd_cmd(
     target: Optional[str] = typer.Argument(None, help="Repo name or relative path (omit for workbench root)."),
@@ -18,6 +16,8 @@ def cd_cmd(
 
     Prints the resolved path to stdout for shell integration.
     """
+    from cli.utils.config import find_workbench_yaml
+
     workbench_root = find_workbench_yaml().parent
 
     if not target:
@@ -26,6 +26,8 @@ def cd_cmd(
         return
 
     # Try as a repo name first
+    from cli.utils.config import load_config
+
     config = load_config()
     if target in config.repos:
         repo_path = workbench_root / config.repos[target].path
@@ -8,27 +8,94 @@ ports, language/framework detection, dependencies, env vars, and health checks.
 from __future__ import annotations
 
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import cache, cached_property
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Iterator, Optional
 
 import typer
-import yaml
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-
-from cli.utils.config import (
-    RepoConfig,
-    WorkbenchConfig,
-    load_config,
-    save_config,
-    find_workbench_yaml,
-)
+
+from cli.utils import filecache
+
+if TYPE_CHECKING:
+    from cli.utils.config import RepoConfig
 
 console = Console()
 
+
+@cache
+def _yaml_loader() -> Any:
+    """Import PyYAML on first use and return its fastest safe loader.
+
+    libyaml's C loader is several times faster; fall back when PyYAML was
+    built without it.
+    """
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _yaml_load(content: bytes) -> Any:
+    import yaml
+
+    return yaml.load(content, Loader=_yaml_loader())
+
+
+# Directories that never hold a repo's own sources; pruned from every tree walk
+_SKIP_DIRS = frozenset({
+    ".git", ".venv", "venv", "node_modules", "__pycache__", "site-packages", "dist", "build",
+})
+
+# Health-route search budget: files visited, and bytes read from each
+_HEALTH_SCAN_MAX_FILES = 500
+_HEALTH_SCAN_READ_BYTES = 64 * 1024
+
+# Files whose mtimes decide whether a repo's cached discovery is still valid.
+# The repo directory itself is checked too, so added or removed files count;
+# anything else a detector reads is recorded on the scan (_RepoScan.inputs).
+_PROBE_FILES = (
+    "package.json", "requirements.txt", "pyproject.toml", "setup.py", "Makefile", "Procfile",
+    ".env.example", "docker-compose.yml", "docker-compose.yaml", "render.yaml",
+    "go.mod", "Cargo.toml", "tsconfig.json",
+)
+
+# Parallel scan defaults: worker count, and the workbench size at which
+# scans move from threads to processes
+_DEFAULT_JOBS = min(os.cpu_count() or 1, 8)
+_PROCESS_POOL_MIN_REPOS = 64
+
+# Files whose combined text is searched for Python dependencies
+_PYTHON_DEP_FILES = ("requirements.txt", "setup.py", "pyproject.toml")
+
+# Start-command candidates, in order of preference
+_START_SCRIPTS = ("dev", "start")
+_START_TARGETS = ("run", "dev", "serve", "start")
+
+# Default ports for frameworks that don't declare one
+_FRAMEWORK_PORTS = {
+    "Next.js": 3000,
+    "FastAPI": 8000,
+    "Expo / React Native": 8081,
+    "React Native": 8081,
+    "Django": 8000,
+    "Flask": 5000,
+    "React": 3000,
+    "Vue": 3000,
+    "Nuxt": 3000,
+}
+
+# Patterns used by the detectors, compiled once at import
+_RE_PORT = re.compile(rb"^PORT\s*=\s*(\d+)")
+_RE_COMPOSE_PORTS = re.compile(rb"^\s+ports:", re.MULTILINE)
+_RE_PROCFILE_WEB = re.compile(r"^web:\s*(.+)$", re.MULTILINE)
+_RE_COMPOSE_PORT = re.compile(r"(\d+):\d+")
+_RE_MAKE_TARGET = re.compile(r"^([a-zA-Z_][\w-]*):", re.MULTILINE)
+_RE_HEALTH = re.compile(r'(?:@\w+\.\w+|router\.\w+)\(\s*["\']/(health|status)["\']')
+
 # ---------------------------------------------------------------------------
 # Typer command
 # ---------------------------------------------------------------------------
@@ -42,13 +109,14 @@ def discover(
     dry_run: bool = typer.Option(False, "--dry-run", "-n", help="Show results without writing"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed detection info"),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Minimal output"),
+    jobs: int = typer.Option(0, "--jobs", "-j", help="Repos to scan in parallel (default: CPU count, up to 8)"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore cached results and rescan every file"),
 ):
     """Auto-detect repository configurations and update workbench.yaml."""
+    from cli.utils.config import find_workbench_yaml, load_config, save_config
 
     if not quiet:
-        console.print()
-        console.print(Text("  workbench discover", style="bold cyan"))
-        console.print()
+        console.print("\n[bold cyan]  workbench discover[/bold cyan]\n")
 
     try:
         config = load_config()
@@ -67,31 +135,37 @@ def discover(
         repos_to_scan = {repo: config.repos[repo]}
 
     if not quiet:
-        console.print("  [dim]Scanning repositories...[/dim]")
-        console.print()
+        console.print("  [dim]Scanning repositories...[/dim]\n")
+
+    filecache.set_refresh(refresh)
 
     results: list[tuple[str, RepoConfig, dict[str, str]]] = []
 
+    scannable = {}
     for name, repo_cfg in repos_to_scan.items():
-        repo_path = root / repo_cfg.path
-        if not repo_path.is_dir():
-            if not quiet:
-                console.print(f"    [yellow]~[/yellow] {name:<18} [dim]directory not found at {repo_cfg.path}[/dim]")
-            continue
-
-        detection_log: dict[str, str] = {}
-        discovered = _discover_repo(repo_path, repo_cfg, detection_log)
-
+        if (root / repo_cfg.path).is_dir():
+            scannable[name] = repo_cfg
+        elif not quiet:
+            console.print(f"    [yellow]~[/yellow] {name:<18} [dim]directory not found at {repo_cfg.path}[/dim]")
+
+    # Each repo is printed as soon as its scan finishes; the summary table
+    # below goes back to config order.
+    for name, repo_cfg, discovered, detection_log in _scan_repos(root, scannable, jobs, refresh):
         # Merge discovered values into the existing config (don't overwrite manual settings)
         _merge_discovered(repo_cfg, discovered)
         results.append((name, repo_cfg, detection_log))
 
+        # One write per repo: the result line plus any verbose detail
+        lines: list[str] = []
         if not quiet:
-            _print_repo_result(name, repo_cfg)
-
+            lines.append(_format_repo_result(name, repo_cfg))
         if verbose:
-            for key, reason in detection_log.items():
-                console.print(f"           [dim]{key}: {reason}[/dim]")
+            lines.extend(f"           [dim]{key}: {reason}[/dim]" for key, reason in detection_log.items())
+        if lines:
+            console.print("\n".join(lines))
+
+    order = list(scannable)
+    results.sort(key=lambda result: order.index(result[0]))
 
     if not quiet:
         console.print()
@@ -100,23 +174,78 @@ def discover(
     if not dry_run:
         config_path = save_config(config)
         if not quiet:
-            console.print(f"  [green]Updated[/green] {config_path.name}")
-            console.print()
+            console.print(f"  [green]Updated[/green] {config_path.name}\n")
     elif not quiet:
-        console.print("  [yellow]Dry run[/yellow] — no changes written")
-        console.print()
+        console.print("  [yellow]Dry run[/yellow] — no changes written\n")
 
     # Summary table
     if not quiet and results:
         _print_summary_table(results)
 
 
+def _scan_repos(
+    root: Path, repos: dict[str, RepoConfig], jobs: int, refresh: bool = False,
+) -> Iterator[tuple[str, RepoConfig, dict[str, Any], dict[str, str]]]:
+    """Scan *repos* concurrently, yielding (name, config, discovered, log) as each completes.
+
+    Detection is mostly filesystem I/O, so threads overlap it well. Very
+    large workbenches spend enough time in the JSON/YAML parsers to hit the
+    GIL, and those go to a process pool instead.
+    """
+    if not repos:
+        return
+    workers = min(jobs if jobs > 0 else _DEFAULT_JOBS, len(repos))
+    use_processes = workers > 1 and len(repos) >= _PROCESS_POOL_MIN_REPOS
+    if use_processes:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Worker processes don't share our module state; pass --refresh on
+        pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=filecache.set_refresh, initargs=(refresh,)
+        )
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+
+    with pool:
+        pending = {}
+        for name, repo_cfg in repos.items():
+            future = pool.submit(_discover_repo_cached, str(root / repo_cfg.path), repo_cfg)
+            pending[future] = (name, repo_cfg)
+
+        for future in as_completed(pending):
+            name, repo_cfg = pending[future]
+            discovered, detection_log = future.result()
+            yield name, repo_cfg, discovered, detection_log
+
+
+def _discover_repo_cached(repo_path: str, repo_cfg: RepoConfig) -> tuple[dict[str, Any], dict[str, str]]:
+    """Run _discover_repo, reusing the last result while none of the files it read have changed.
+
+    Also the pool entry point, so arguments and result are picklable.
+    """
+    repo_dir = Path(os.path.abspath(repo_path))
+    probes = [repo_dir] + [repo_dir / name for name in _PROBE_FILES]
+    hit, entry = filecache.load("discover/repo", probes)
+    if hit and entry["infrastructure"] == repo_cfg.is_infrastructure:
+        return entry["discovered"], entry["log"]
+
+    log: dict[str, str] = {}
+    scan = _RepoScan.of(repo_dir)
+    discovered = _discover_repo(scan, repo_cfg, log)
+    filecache.store("discover/repo", probes, {
+        "infrastructure": repo_cfg.is_infrastructure,
+        "discovered": discovered,
+        "log": log,
+    }, depends=scan.inputs)
+    return discovered, log
+
+
 # ---------------------------------------------------------------------------
 # Pretty printing
 # ---------------------------------------------------------------------------
 
-def _print_repo_result(name: str, repo: RepoConfig) -> None:
-    """Print a single-line discovery result for a repo."""
+def _format_repo_result(name: str, repo: RepoConfig) -> str:
+    """Format a single-line discovery result for a repo."""
     parts: list[str] = []
     if repo.language:
         parts.append(repo.language)
@@ -129,11 +258,14 @@ def _print_repo_result(name: str, repo: RepoConfig) -> None:
 
     detail = " [dim]\u00b7[/dim] ".join(parts) if parts else "[dim]no config detected[/dim]"
     glyph = "[green]\u2713[/green]"
-    console.print(f"    {glyph} {name:<18} {detail}")
+    return f"    {glyph} {name:<18} {detail}"
 
 
 def _print_summary_table(results: list[tuple[str, RepoConfig, dict[str, str]]]) -> None:
     """Print a summary table of all discovered repos."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     table = Table(
         title=None,
         show_header=True,
@@ -174,28 +306,88 @@ def _truncate(s: str | None, max_len: int) -> str:
 # Discovery engine
 # ---------------------------------------------------------------------------
 
-def _discover_repo(repo_path: Path, repo_cfg: RepoConfig, log: dict[str, str]) -> dict[str, Any]:
+@dataclass
+class _RepoScan:
+    """A repo's top-level directory listing, shared by all detectors.
+
+    Listing the directory once with os.scandir turns the many per-file
+    exists() probes made during detection into set lookups. Manifests that
+    several detectors consult are read and parsed once, on first use.
+
+    Detectors reach any other file through file() or walk(), which record
+    it in *inputs* so a cached result is invalidated when it changes.
+    """
+
+    path: Path
+    files: frozenset[str]
+    inputs: list[Path] = field(default_factory=list)
+
+    @classmethod
+    def of(cls, repo_path: Path) -> _RepoScan:
+        # Entry types come from the directory listing itself, so neither check
+        # stats the file. Symlinks are kept without being followed (lock files
+        # are often linked in); a dangling one fails later, when it is read.
+        try:
+            with os.scandir(repo_path) as it:
+                files = frozenset(
+                    entry.name for entry in it
+                    if entry.is_file(follow_symlinks=False) or entry.is_symlink()
+                )
+        except OSError:
+            files = frozenset()
+        return cls(repo_path, files)
+
+    def file(self, *parts: str) -> Path:
+        """Return the path of a file in the repo, recording it as an input."""
+        path = self.path.joinpath(*parts)
+        self.inputs.append(path)
+        return path
+
+    def walk(self, suffix: str) -> Iterator[str]:
+        """_walk_files() over the repo, recording each directory listed and file yielded."""
+        for path in _walk_files(self.path, suffix, self.inputs):
+            self.inputs.append(Path(path))
+            yield path
+
+    @cached_property
+    def pkg_json(self) -> dict[str, Any] | None:
+        return _read_package_json(self)
+
+    @cached_property
+    def python_deps(self) -> str | None:
+        return _read_python_deps(self)
+
+    @cached_property
+    def makefile_text(self) -> str | None:
+        return _read_makefile(self)
+
+    @cached_property
+    def makefile_targets(self) -> set[str]:
+        return _parse_makefile_targets(self.makefile_text) if self.makefile_text else set()
+
+
+def _discover_repo(scan: _RepoScan, repo_cfg: RepoConfig, log: dict[str, str]) -> dict[str, Any]:
     """Run all detectors on a single repo. Returns a dict of discovered values."""
     discovered: dict[str, Any] = {}
 
     # Skip deep detection for infrastructure repos
     is_infra = repo_cfg.is_infrastructure
 
-    discovered["language"] = _detect_language(repo_path, log)
-    discovered["framework"] = _detect_framework(repo_path, discovered["language"], log)
+    discovered["language"] = _detect_language(scan, log)
+    discovered["framework"] = _detect_framework(scan, discovered["language"], log)
 
     if not is_infra:
-        discovered["start_command"] = _detect_start_command(repo_path, discovered["language"], log)
-        discovered["port"] = _detect_port(repo_path, discovered["framework"], log)
-        discovered["health_check"] = _detect_health_check(repo_path, discovered["language"], discovered["framework"], log)
-        discovered["install_command"] = _detect_install_command(repo_path, discovered["language"], log)
+        discovered["start_command"] = _detect_start_command(scan, discovered["language"], log)
+        discovered["port"] = _detect_port(scan, discovered["framework"], log)
+        discovered["health_check"] = _detect_health_check(scan, discovered["language"], discovered["framework"], log)
+        discovered["install_command"] = _detect_install_command(scan, discovered["language"], log)
     else:
         log["start_command"] = "skipped (infrastructure repo)"
         log["port"] = "skipped (infrastructure repo)"
         log["health_check"] = "skipped (infrastructure repo)"
 
-    discovered["dependencies"] = _detect_dependencies(repo_path, discovered["language"], log)
-    discovered["env_file"] = _detect_env_file(repo_path, log)
+    discovered["dependencies"] = _detect_dependencies(scan, discovered["language"], log)
+    discovered["env_file"] = _detect_env_file(scan, log)
 
     return discovered
 
@@ -211,41 +403,41 @@ def _merge_discovered(repo: RepoConfig, discovered: dict[str, Any]) -> None:
 # Language detection
 # ---------------------------------------------------------------------------
 
-def _detect_language(repo_path: Path, log: dict[str, str]) -> str | None:
-    if (repo_path / "package.json").exists():
+def _detect_language(scan: _RepoScan, log: dict[str, str]) -> str | None:
+    if "package.json" in scan.files:
         # Check for TypeScript indicators
-        if (repo_path / "tsconfig.json").exists():
+        if "tsconfig.json" in scan.files:
             log["language"] = "tsconfig.json found"
             return "TypeScript"
         log["language"] = "package.json found"
         return "JavaScript"
 
-    if (repo_path / "requirements.txt").exists():
+    if "requirements.txt" in scan.files:
         log["language"] = "requirements.txt found"
         return "Python"
 
-    if (repo_path / "pyproject.toml").exists():
+    if "pyproject.toml" in scan.files:
         log["language"] = "pyproject.toml found"
         return "Python"
 
-    if (repo_path / "setup.py").exists():
+    if "setup.py" in scan.files:
         log["language"] = "setup.py found"
         return "Python"
 
-    # Check for Terraform files
-    tf_files = list(repo_path.glob("**/*.tf"))
-    if tf_files:
-        log["language"] = f"found {len(tf_files)} .tf files"
-        return "HCL"
-
-    if (repo_path / "go.mod").exists():
+    if "go.mod" in scan.files:
         log["language"] = "go.mod found"
         return "Go"
 
-    if (repo_path / "Cargo.toml").exists():
+    if "Cargo.toml" in scan.files:
         log["language"] = "Cargo.toml found"
         return "Rust"
 
+    # Terraform needs a tree walk, so only look once the cheap markers missed,
+    # and stop at the first .tf file found
+    if next(scan.walk(".tf"), None) is not None:
+        log["language"] = "found .tf files"
+        return "HCL"
+
     log["language"] = "no language indicators found"
     return None
 
@@ -254,11 +446,11 @@ def _detect_language(repo_path: Path, log: dict[str, str]) -> str | None:
 # Framework detection
 # ---------------------------------------------------------------------------
 
-def _detect_framework(repo_path: Path, language: str | None, log: dict[str, str]) -> str | None:
+def _detect_framework(scan: _RepoScan, language: str | None, log: dict[str, str]) -> str | None:
     if language == "Python":
-        return _detect_python_framework(repo_path, log)
+        return _detect_python_framework(scan, log)
     if language in ("TypeScript", "JavaScript"):
-        return _detect_js_framework(repo_path, log)
+        return _detect_js_framework(scan, log)
     if language == "HCL":
         log["framework"] = "HCL files detected"
         return "Terraform"
@@ -266,9 +458,9 @@ def _detect_framework(repo_path: Path, language: str | None, log: dict[str, str]
     return None
 
 
-def _detect_python_framework(repo_path: Path, log: dict[str, str]) -> str | None:
+def _detect_python_framework(scan: _RepoScan, log: dict[str, str]) -> str | None:
     """Detect Python web frameworks from requirements files."""
-    deps = _read_python_deps(repo_path)
+    deps = scan.python_deps
     if not deps:
         log["framework"] = "no dependency files found"
         return None
@@ -291,9 +483,9 @@ def _detect_python_framework(repo_path: Path, log: dict[str, str]) -> str | None
     return None
 
 
-def _detect_js_framework(repo_path: Path, log: dict[str, str]) -> str | None:
+def _detect_js_framework(scan: _RepoScan, log: dict[str, str]) -> str | None:
     """Detect JS/TS frameworks from package.json."""
-    pkg = _read_package_json(repo_path)
+    pkg = scan.pkg_json
     if not pkg:
         log["framework"] = "no package.json found"
         return None
@@ -327,52 +519,43 @@ def _detect_js_framework(repo_path: Path, log: dict[str, str]) -> str | None:
 # Start command detection
 # ---------------------------------------------------------------------------
 
-def _detect_start_command(repo_path: Path, language: str | None, log: dict[str, str]) -> str | None:
+def _detect_start_command(scan: _RepoScan, language: str | None, log: dict[str, str]) -> str | None:
     # 1. package.json scripts
-    pkg = _read_package_json(repo_path)
+    pkg = scan.pkg_json
     if pkg:
         scripts = pkg.get("scripts", {})
-        if "dev" in scripts:
-            log["start_command"] = f"package.json scripts.dev = \"{scripts['dev']}\""
-            pkg_manager = _detect_package_manager(repo_path)
-            return f"{pkg_manager} dev"
-        if "start" in scripts:
-            log["start_command"] = f"package.json scripts.start = \"{scripts['start']}\""
-            pkg_manager = _detect_package_manager(repo_path)
-            return f"{pkg_manager} start"
+        script = next((s for s in _START_SCRIPTS if s in scripts), None)
+        if script:
+            log["start_command"] = f"package.json scripts.{script} = \"{scripts[script]}\""
+            pkg_manager = _detect_package_manager(scan)
+            return f"{pkg_manager} {script}"
 
     # 2. Makefile targets
-    makefile = _read_makefile(repo_path)
-    if makefile:
-        targets = _parse_makefile_targets(makefile)
-        if "run" in targets:
-            log["start_command"] = f"Makefile target 'run'"
-            return "make run"
-        if "dev" in targets:
-            log["start_command"] = f"Makefile target 'dev'"
-            return "make dev"
-        if "serve" in targets:
-            log["start_command"] = f"Makefile target 'serve'"
-            return "make serve"
-        if "start" in targets:
-            log["start_command"] = f"Makefile target 'start'"
-            return "make start"
+    targets = scan.makefile_targets
+    target = next((t for t in _START_TARGETS if t in targets), None)
+    if target:
+        log["start_command"] = f"Makefile target '{target}'"
+        return f"make {target}"
 
     # 3. Procfile
-    procfile_path = repo_path / "Procfile"
-    if procfile_path.exists():
-        content = procfile_path.read_text()
-        match = re.search(r"^web:\s*(.+)$", content, re.MULTILINE)
+    if "Procfile" in scan.files:
+        try:
+            content = scan.file("Procfile").read_text()
+        except OSError:
+            content = ""
+        match = _RE_PROCFILE_WEB.search(content)
         if match:
             log["start_command"] = f"Procfile web process"
             return match.group(1).strip()
 
     # 4. render.yaml
-    render_path = repo_path / "render.yaml"
-    if render_path.exists():
+    if "render.yaml" in scan.files:
         try:
-            with open(render_path) as f:
-                render = yaml.safe_load(f) or {}
+            content = scan.file("render.yaml").read_bytes()
+            render = {}
+            # Most render.yaml files set no startCommand; skip the parse for those
+            if b"startCommand" in content:
+                render = _yaml_load(content) or {}
             services = render.get("services", [])
             if services and isinstance(services, list):
                 cmd = services[0].get("startCommand")
@@ -384,8 +567,8 @@ def _detect_start_command(repo_path: Path, language: str | None, log: dict[str,
 
     # 5. Python fallback: look for main.py with uvicorn/gunicorn
     if language == "Python":
-        if (repo_path / "main.py").exists():
-            deps = _read_python_deps(repo_path)
+        if "main.py" in scan.files:
+            deps = scan.python_deps
             if deps and "uvicorn" in deps.lower():
                 log["start_command"] = "main.py + uvicorn in dependencies"
                 return "uvicorn main:app --reload"
@@ -398,32 +581,31 @@ def _detect_start_command(repo_path: Path, language: str | None, log: dict[str,
 # Port detection
 # ---------------------------------------------------------------------------
 
-def _detect_port(repo_path: Path, framework: str | None, log: dict[str, str]) -> int | None:
+def _detect_port(scan: _RepoScan, framework: str | None, log: dict[str, str]) -> int | None:
     # 1. .env.example / .env.template files
     for env_name in (".env.example", ".env.template", ".env.sample"):
-        env_path = repo_path / env_name
-        if env_path.exists():
-            content = env_path.read_text()
-            match = re.search(r"^PORT\s*=\s*(\d+)", content, re.MULTILINE)
-            if match:
-                log["port"] = f"PORT={match.group(1)} in {env_name}"
-                return int(match.group(1))
+        if env_name in scan.files:
+            port = _read_env_port(scan.file(env_name))
+            if port:
+                log["port"] = f"PORT={port} in {env_name}"
+                return int(port)
 
     # 2. docker-compose.yml ports
-    compose_path = repo_path / "docker-compose.yml"
-    if not compose_path.exists():
-        compose_path = repo_path / "docker-compose.yaml"
-    if compose_path.exists():
+    compose_name = "docker-compose.yml" if "docker-compose.yml" in scan.files else "docker-compose.yaml"
+    if compose_name in scan.files:
         try:
-            with open(compose_path) as f:
-                compose = yaml.safe_load(f) or {}
+            content = scan.file(compose_name).read_bytes()
+            compose = {}
+            # Only pay for a YAML parse when some service actually maps ports
+            if _RE_COMPOSE_PORTS.search(content):
+                compose = _yaml_load(content) or {}
             services = compose.get("services", {})
             for svc_name, svc_data in services.items():
                 ports = svc_data.get("ports", [])
                 for port_mapping in ports:
                     port_str = str(port_mapping)
                     # Parse "host:container" or just "port"
-                    match = re.search(r"(\d+):\d+", port_str)
+                    match = _RE_COMPOSE_PORT.search(port_str)
                     if match:
                         # This is a shared service port (like postgres), not the app port
                         # Only use if service name matches repo context
@@ -432,20 +614,10 @@ def _detect_port(repo_path: Path, framework: str | None, log: dict[str, str]) ->
             pass
 
     # 3. Framework defaults
-    framework_ports = {
-        "Next.js": 3000,
-        "FastAPI": 8000,
-        "Expo / React Native": 8081,
-        "React Native": 8081,
-        "Django": 8000,
-        "Flask": 5000,
-        "React": 3000,
-        "Vue": 3000,
-        "Nuxt": 3000,
-    }
-    if framework and framework in framework_ports:
+    port = _FRAMEWORK_PORTS.get(framework)
+    if port:
         log["port"] = f"framework default for {framework}"
-        return framework_ports[framework]
+        return port
 
     log["port"] = "no port detected"
     return None
@@ -456,32 +628,36 @@ def _detect_port(repo_path: Path, framework: str | None, log: dict[str, str]) ->
 # ---------------------------------------------------------------------------
 
 def _detect_health_check(
-    repo_path: Path,
+    scan: _RepoScan,
     language: str | None,
     framework: str | None,
     log: dict[str, str],
 ) -> str | None:
     # FastAPI: search for /health or /status routes
     if framework == "FastAPI" or language == "Python":
-        for py_file in repo_path.rglob("*.py"):
+        # Other Python apps are only worth searching if they have a top-level entrypoint
+        if framework != "FastAPI" and "main.py" not in scan.files and "app.py" not in scan.files:
+            log["health_check"] = "skipped (framework has no conventional /health)"
+            return None
+
+        for scanned, py_file in enumerate(scan.walk(".py")):
+            if scanned >= _HEALTH_SCAN_MAX_FILES:
+                break
             try:
-                content = py_file.read_text(errors="ignore")
-            except Exception:
+                with open(py_file, errors="ignore") as f:
+                    content = f.read(_HEALTH_SCAN_READ_BYTES)
+            except OSError:
                 continue
             # Look for route decorators with health or status paths
-            for pattern in [
-                r'@\w+\.\w+\(\s*["\']/(health|status)["\']',
-                r'router\.\w+\(\s*["\']/(health|status)["\']',
-            ]:
-                match = re.search(pattern, content)
-                if match:
-                    endpoint = f"/{match.group(1)}"
-                    log["health_check"] = f"found {endpoint} route in {py_file.relative_to(repo_path)}"
-                    return endpoint
+            match = _RE_HEALTH.search(content)
+            if match:
+                endpoint = f"/{match.group(1)}"
+                log["health_check"] = f"found {endpoint} route in {Path(py_file).relative_to(scan.path)}"
+                return endpoint
 
     # Next.js: check for api/health route
     if framework == "Next.js":
-        api_health = repo_path / "src" / "app" / "api" / "health" / "route.ts"
+        api_health = scan.file("src", "app", "api", "health", "route.ts")
         if api_health.exists():
             log["health_check"] = "found src/app/api/health/route.ts"
             return "/api/health"
@@ -502,28 +678,25 @@ def _detect_health_check(
 # Install command detection
 # ---------------------------------------------------------------------------
 
-def _detect_install_command(repo_path: Path, language: str | None, log: dict[str, str]) -> str | None:
+def _detect_install_command(scan: _RepoScan, language: str | None, log: dict[str, str]) -> str | None:
     # Node.js package managers
-    if (repo_path / "package.json").exists():
-        pkg_manager = _detect_package_manager(repo_path)
+    if "package.json" in scan.files:
+        pkg_manager = _detect_package_manager(scan)
         log["install_command"] = f"{pkg_manager} detected from lock file"
         return f"{pkg_manager} install"
 
     # Python
     if language == "Python":
         # Prefer Makefile install target
-        makefile = _read_makefile(repo_path)
-        if makefile:
-            targets = _parse_makefile_targets(makefile)
-            if "install" in targets:
-                log["install_command"] = "Makefile install target"
-                return "make install"
-
-        if (repo_path / "setup.py").exists() or (repo_path / "pyproject.toml").exists():
+        if "install" in scan.makefile_targets:
+            log["install_command"] = "Makefile install target"
+            return "make install"
+
+        if "setup.py" in scan.files or "pyproject.toml" in scan.files:
             log["install_command"] = "setup.py/pyproject.toml found"
             return "pip install -e ."
 
-        if (repo_path / "requirements.txt").exists():
+        if "requirements.txt" in scan.files:
             log["install_command"] = "requirements.txt found"
             return "pip install -r requirements.txt"
 
@@ -535,23 +708,23 @@ def _detect_install_command(repo_path: Path, language: str | None, log: dict[str
 # Dependency file detection
 # ---------------------------------------------------------------------------
 
-def _detect_dependencies(repo_path: Path, language: str | None, log: dict[str, str]) -> str | None:
-    if (repo_path / "package.json").exists():
+def _detect_dependencies(scan: _RepoScan, language: str | None, log: dict[str, str]) -> str | None:
+    if "package.json" in scan.files:
         log["dependencies"] = "package.json"
         return "package.json"
-    if (repo_path / "requirements.txt").exists():
+    if "requirements.txt" in scan.files:
         log["dependencies"] = "requirements.txt"
         return "requirements.txt"
-    if (repo_path / "pyproject.toml").exists():
+    if "pyproject.toml" in scan.files:
         log["dependencies"] = "pyproject.toml"
         return "pyproject.toml"
-    if (repo_path / "setup.py").exists():
+    if "setup.py" in scan.files:
         log["dependencies"] = "setup.py"
         return "setup.py"
-    if (repo_path / "go.mod").exists():
+    if "go.mod" in scan.files:
         log["dependencies"] = "go.mod"
         return "go.mod"
-    if (repo_path / "Cargo.toml").exists():
+    if "Cargo.toml" in scan.files:
         log["dependencies"] = "Cargo.toml"
         return "Cargo.toml"
     log["dependencies"] = "no dependency file found"
@@ -562,9 +735,9 @@ def _detect_dependencies(repo_path: Path, language: str | None, log: dict[str, s
 # Env file detection
 # ---------------------------------------------------------------------------
 
-def _detect_env_file(repo_path: Path, log: dict[str, str]) -> str | None:
+def _detect_env_file(scan: _RepoScan, log: dict[str, str]) -> str | None:
     for name in (".env.example", ".env.template", ".env.sample"):
-        if (repo_path / name).exists():
+        if name in scan.files:
             log["env_file"] = name
             return name
     log["env_file"] = "no env template found"
@@ -575,36 +748,48 @@ def _detect_env_file(repo_path: Path, log: dict[str, str]) -> str | None:
 # File reading helpers
 # ---------------------------------------------------------------------------
 
-def _read_package_json(repo_path: Path) -> dict[str, Any] | None:
-    pkg_path = repo_path / "package.json"
-    if not pkg_path.exists():
+@filecache.cached("discover/package_json", lambda scan: [scan.path / "package.json"])
+def _read_package_json(scan: _RepoScan) -> dict[str, Any] | None:
+    if "package.json" not in scan.files:
         return None
     try:
-        with open(pkg_path) as f:
+        with open(scan.path / "package.json") as f:
             return json.load(f)
     except (json.JSONDecodeError, OSError):
         return None
 
 
-def _read_python_deps(repo_path: Path) -> str | None:
+@filecache.cached("discover/python_deps", lambda scan: [scan.path / name for name in _PYTHON_DEP_FILES])
+def _read_python_deps(scan: _RepoScan) -> str | None:
     """Read combined text from requirements.txt, setup.py, pyproject.toml."""
     parts: list[str] = []
-    for name in ("requirements.txt", "setup.py", "pyproject.toml"):
-        dep_path = repo_path / name
-        if dep_path.exists():
+    for name in _PYTHON_DEP_FILES:
+        if name in scan.files:
             try:
-                parts.append(dep_path.read_text(errors="ignore"))
+                parts.append((scan.path / name).read_text(errors="ignore"))
             except OSError:
                 pass
     return "\n".join(parts) if parts else None
 
 
-def _read_makefile(repo_path: Path) -> str | None:
+def _read_env_port(env_path: Path) -> str | None:
+    """Return the PORT value from an env template, stopping at the first match."""
+    try:
+        with open(env_path, "rb") as f:
+            for line in f:
+                match = _RE_PORT.match(line)
+                if match:
+                    return match.group(1).decode()
+    except OSError:
+        pass
+    return None
+
+
+def _read_makefile(scan: _RepoScan) -> str | None:
     for name in ("Makefile", "makefile", "GNUmakefile"):
-        mf_path = repo_path / name
-        if mf_path.exists():
+        if name in scan.files:
             try:
-                return mf_path.read_text(errors="ignore")
+                return scan.file(name).read_text(errors="ignore")
             except OSError:
                 pass
     return None
@@ -612,21 +797,41 @@ def _read_makefile(repo_path: Path) -> str | None:
 
 def _parse_makefile_targets(content: str) -> set[str]:
     """Extract target names from a Makefile."""
-    targets: set[str] = set()
-    for line in content.splitlines():
-        match = re.match(r"^([a-zA-Z_][\w-]*):", line)
-        if match:
-            targets.add(match.group(1))
-    return targets
+    return {match.group(1) for match in _RE_MAKE_TARGET.finditer(content)}
+
+
+def _walk_files(root: Path, suffix: str, visited: list[Path] | None = None) -> Iterator[str]:
+    """Lazily yield paths of files under *root* ending in *suffix*.
+
+    Uses os.scandir so directory entries carry their type without extra
+    stat calls, and never descends into _SKIP_DIRS or symlinked directories.
+    Each directory listed is appended to *visited*, if given.
+    """
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        if visited is not None:
+            visited.append(Path(directory))
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(suffix):
+                    yield entry.path
 
 
-def _detect_package_manager(repo_path: Path) -> str:
+def _detect_package_manager(scan: _RepoScan) -> str:
     """Detect which Node.js package manager to use."""
-    if (repo_path / "yarn.lock").exists():
+    if "yarn.lock" in scan.files:
         return "yarn"
-    if (repo_path / "pnpm-lock.yaml").exists():
+    if "pnpm-lock.yaml" in scan.files:
         return "pnpm"
-    if (repo_path / "bun.lockb").exists():
+    if "bun.lockb" in scan.files:
         return "bun"
     return "npm"
 
@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 
-import shutil
 import subprocess
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
 
 import typer
 from rich.console import Console
-from rich.prompt import Confirm, Prompt
 
 from cli.utils import git
-from cli.utils.config import load_config, find_workbench_yaml, RepoConfig
+
+if TYPE_CHECKING:
+    from cli.utils.config import RepoConfig
 
 console = Console()
 feature_app = typer.Typer(name="feature", help="Cross-repo feature workflow.")
@@ -24,6 +25,14 @@ feature_app = typer.Typer(name="feature", help="Cross-repo feature workflow.")
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _load_app_repos() -> tuple[Path, dict[str, tuple[RepoConfig, Path]]]:
+    """Return the workbench root and its cloned app repos."""
+    from cli.utils.config import get_workbench_context
+
+    config, workbench_root = get_workbench_context()
+    return workbench_root, _get_app_repos(config, workbench_root)
+
+
 def _get_app_repos(config, workbench_root: Path) -> dict[str, tuple[RepoConfig, Path]]:
     """Return non-infrastructure repos that are cloned."""
     repos: dict[str, tuple[RepoConfig, Path]] = {}
@@ -37,14 +46,28 @@ def _get_app_repos(config, workbench_root: Path) -> dict[str, tuple[RepoConfig,
     return repos
 
 
-def _detect_feature_from(paths: dict[str, Path]) -> str | None:
-    """Auto-detect the current feature by finding feat/* branches across paths.
+def _fan_out(paths: dict[str, Path], work: Callable[[str, Path], Any]) -> Iterator[tuple[str, Any]]:
+    """Run *work(name, path)* for every entry of *paths* concurrently.
 
-    *paths* maps a label (repo name or "workbench") to a directory.
+    Each call is mostly waiting on a git (or gh) subprocess, so the total
+    time is roughly that of the slowest repo. Results are yielded as
+    (name, result) in the order of *paths*, keeping printed output stable.
+    """
+    if not paths:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        futures = {name: pool.submit(work, name, path) for name, path in paths.items()}
+        for name, future in futures.items():
+            yield name, future.result()
+
+
+def _detect_feature_from(branches: dict[str, str]) -> str | None:
+    """Auto-detect the current feature by finding feat/* branches.
+
+    *branches* maps a label (repo name or "workbench") to its current branch.
     """
     feature_branches: dict[str, list[str]] = defaultdict(list)
-    for name, path in paths.items():
-        branch = git.current_branch(path)
+    for name, branch in branches.items():
         if branch.startswith("feat/"):
             feature_branches[branch].append(name)
 
@@ -54,6 +77,8 @@ def _detect_feature_from(paths: dict[str, Path]) -> str | None:
         return next(iter(feature_branches))
 
     # Multiple features — pick the one present in the most repos
+    from rich.prompt import Prompt
+
     console.print("\n  [yellow]Multiple feature branches detected:[/yellow]\n")
     sorted_features = sorted(feature_branches.items(), key=lambda x: len(x[1]), reverse=True)
     for i, (branch, repo_names) in enumerate(sorted_features, 1):
@@ -67,14 +92,27 @@ def _detect_feature_from(paths: dict[str, Path]) -> str | None:
     return sorted_features[int(choice) - 1][0]
 
 
-def _detect_feature(repos: dict[str, tuple[RepoConfig, Path]], workbench_root: Path | None = None) -> str | None:
-    """Auto-detect the current feature across app repos (and optionally workbench root)."""
+def _detect_feature(
+    repos: dict[str, tuple[RepoConfig, Path]], workbench_root: Path | None = None,
+) -> tuple[str | None, dict[str, tuple[str, int]]]:
+    """Auto-detect the current feature across app repos (and optionally workbench root).
+
+    Returns the feature (or None) and the (branch, modified_count) snapshot
+    of every path checked, so commands don't have to ask git again.
+    """
     paths: dict[str, Path] = {}
     if workbench_root:
         paths["workbench"] = workbench_root
     for name, (_cfg, path) in repos.items():
         paths[name] = path
-    return _detect_feature_from(paths)
+    snapshots = _snapshots(paths)
+    branches = {name: branch for name, (branch, _modified) in snapshots.items()}
+    return _detect_feature_from(branches), snapshots
+
+
+def _snapshots(paths: dict[str, Path]) -> dict[str, tuple[str, int]]:
+    """Return (branch, modified_count) for every path, one git process each."""
+    return dict(_fan_out(paths, lambda _name, path: git.status_snapshot(path)))
 
 
 def _branch_name(name: str) -> str:
@@ -107,12 +145,11 @@ def start_cmd(
 ) -> None:
     """Create a feature branch across repos."""
     from cli.main import banner
+    from rich.prompt import Confirm
 
     banner()
 
-    config = load_config()
-    workbench_root = find_workbench_yaml().parent
-    all_repos = _get_app_repos(config, workbench_root)
+    workbench_root, all_repos = _load_app_repos()
 
     # Filter to requested repos
     if repos:
@@ -134,11 +171,12 @@ def start_cmd(
 
     console.print(f"\n  [bold]→[/bold] Creating feature branches: [cyan]{branch}[/cyan]\n")
 
+    # Workbench root first (its branch shows in the shell prompt), then app repos
+    targets: dict[str, Path] = {"workbench": workbench_root}
+    targets.update((n, p) for n, (_c, p) in target_repos.items())
+
     # Check for dirty repos (including workbench itself)
-    dirty_names: list[str] = []
-    if git.is_dirty(workbench_root):
-        dirty_names.append("workbench")
-    dirty_names.extend(n for n, (_c, p) in target_repos.items() if git.is_dirty(p))
+    dirty_names = [n for n, (_branch, modified) in _snapshots(targets).items() if modified]
     if dirty_names:
         console.print(f"  [yellow]![/yellow] Dirty repos: {', '.join(dirty_names)}")
         if not Confirm.ask("  Continue anyway?", default=True):
@@ -146,22 +184,10 @@ def start_cmd(
             raise typer.Exit(0)
         console.print()
 
-    # Create branch in workbench root first (for shell prompt)
-    wb_default = git.get_default_branch(workbench_root)
-    wb_result = git.create_branch(workbench_root, branch)
-    if wb_result.returncode == 0:
-        console.print(
-            f"    [green]✓[/green] {'workbench':<20} [cyan]{branch}[/cyan] "
-            f"[dim](from {wb_default})[/dim]"
-        )
-    else:
-        err = wb_result.stderr.strip()
-        console.print(f"    [red]✗[/red] {'workbench':<20} {err}")
+    def _create(_name: str, repo_path: Path) -> tuple[str, subprocess.CompletedProcess[str]]:
+        return git.get_default_branch(repo_path), git.create_branch(repo_path, branch)
 
-    # Create branches in app repos
-    for repo_name, (_cfg, repo_path) in target_repos.items():
-        default_branch = git.get_default_branch(repo_path)
-        result = git.create_branch(repo_path, branch)
+    for repo_name, (default_branch, result) in _fan_out(targets, _create):
         if result.returncode == 0:
             console.print(
                 f"    [green]✓[/green] {repo_name:<20} [cyan]{branch}[/cyan] "
@@ -196,27 +222,24 @@ def status_cmd() -> None:
 
     banner()
 
-    config = load_config()
-    workbench_root = find_workbench_yaml().parent
-    all_repos = _get_app_repos(config, workbench_root)
+    workbench_root, all_repos = _load_app_repos()
 
     if not all_repos:
         console.print("\n  [red]✗[/red] No repos available.\n")
         raise typer.Exit(1)
 
-    feature = _detect_feature(all_repos, workbench_root)
+    feature, snapshots = _detect_feature(all_repos, workbench_root)
     if not feature:
         console.print("\n  [dim]No feature branch detected in any repo.[/dim]\n")
         raise typer.Exit(0)
 
     console.print(f"\n  [bold]Feature:[/bold] [cyan]{feature}[/cyan]\n")
 
-    def _print_repo_status(name: str, repo_path: Path) -> None:
-        branch = git.current_branch(repo_path)
+    def _repo_status(name: str, repo_path: Path) -> str:
+        branch, modified = snapshots[name]
         if branch == feature:
             default_branch = git.get_default_branch(repo_path)
             ahead = git.commits_ahead_of(repo_path, default_branch)
-            modified = git.get_modified_count(repo_path)
 
             parts = []
             if ahead:
@@ -227,18 +250,16 @@ def status_cmd() -> None:
                 parts.append("clean")
             detail = " · ".join(parts)
 
-            console.print(
-                f"    {name:<20} [cyan]{branch}[/cyan]   {detail}"
-            )
-        else:
-            console.print(
-                f"    {name:<20} [dim]{branch}[/dim]"
-                f"   [dim]○ not on feature branch[/dim]"
-            )
+            return f"    {name:<20} [cyan]{branch}[/cyan]   {detail}"
+        return (
+            f"    {name:<20} [dim]{branch}[/dim]"
+            f"   [dim]○ not on feature branch[/dim]"
+        )
 
-    _print_repo_status("workbench", workbench_root)
-    for repo_name, (_cfg, repo_path) in all_repos.items():
-        _print_repo_status(repo_name, repo_path)
+    targets: dict[str, Path] = {"workbench": workbench_root}
+    targets.update((n, p) for n, (_c, p) in all_repos.items())
+    for _name, line in _fan_out(targets, _repo_status):
+        console.print(line)
 
     console.print()
 
@@ -250,37 +271,36 @@ def push_cmd() -> None:
 
     banner()
 
-    config = load_config()
-    workbench_root = find_workbench_yaml().parent
-    all_repos = _get_app_repos(config, workbench_root)
+    workbench_root, all_repos = _load_app_repos()
 
-    feature = _detect_feature(all_repos, workbench_root)
+    feature, snapshots = _detect_feature(all_repos, workbench_root)
     if not feature:
         console.print("\n  [dim]No feature branch detected.[/dim]\n")
         raise typer.Exit(0)
 
     console.print(f"\n  [bold]→[/bold] Pushing repos on [cyan]{feature}[/cyan]\n")
 
-    pushed_any = False
-    for repo_name, (_cfg, repo_path) in all_repos.items():
-        branch = git.current_branch(repo_path)
+    def _push(repo_name: str, repo_path: Path) -> tuple[str, bool]:
+        branch, _modified = snapshots[repo_name]
         if branch != feature:
-            console.print(f"    [dim]○[/dim] {repo_name:<20} [dim]skipped (not on feature branch)[/dim]")
-            continue
+            return f"    [dim]○[/dim] {repo_name:<20} [dim]skipped (not on feature branch)[/dim]", False
 
         default_branch = git.get_default_branch(repo_path)
         ahead = git.commits_ahead_of(repo_path, default_branch)
         if ahead == 0 and not git.has_remote_branch(repo_path, branch):
-            console.print(f"    [dim]○[/dim] {repo_name:<20} [dim]skipped (no commits ahead)[/dim]")
-            continue
+            return f"    [dim]○[/dim] {repo_name:<20} [dim]skipped (no commits ahead)[/dim]", False
 
         result = git.push_with_upstream(repo_path)
         if result.returncode == 0:
-            console.print(f"    [green]✓[/green] {repo_name:<20} pushed")
-            pushed_any = True
-        else:
-            err = result.stderr.strip()
-            console.print(f"    [red]✗[/red] {repo_name:<20} push failed: {err}")
+            return f"    [green]✓[/green] {repo_name:<20} pushed", True
+        err = result.stderr.strip()
+        return f"    [red]✗[/red] {repo_name:<20} push failed: {err}", False
+
+    pushed_any = False
+    paths = {n: p for n, (_c, p) in all_repos.items()}
+    for _name, (line, pushed) in _fan_out(paths, _push):
+        console.print(line)
+        pushed_any = pushed_any or pushed
 
     if not pushed_any:
         console.print("\n  [dim]Nothing to push.[/dim]")
@@ -296,6 +316,7 @@ def pr_cmd(
 ) -> None:
     """Create pull requests for each repo on the feature branch."""
     from cli.main import banner
+    import shutil
 
     banner()
 
@@ -305,11 +326,9 @@ def pr_cmd(
         console.print("  [dim]Install it: https://cli.github.com[/dim]\n")
         raise typer.Exit(1)
 
-    config = load_config()
-    workbench_root = find_workbench_yaml().parent
-    all_repos = _get_app_repos(config, workbench_root)
+    workbench_root, all_repos = _load_app_repos()
 
-    feature = _detect_feature(all_repos, workbench_root)
+    feature, snapshots = _detect_feature(all_repos, workbench_root)
     if not feature:
         console.print("\n  [dim]No feature branch detected.[/dim]\n")
         raise typer.Exit(0)
@@ -318,24 +337,18 @@ def pr_cmd(
 
     console.print(f"\n  [bold]→[/bold] Creating pull requests for [cyan]{feature}[/cyan]\n")
 
-    # First pass: create PRs
-    created_prs: dict[str, str] = {}  # repo_name -> PR URL
+    pr_body = body or f"Part of cross-repo feature: **{feature}**"
 
-    for repo_name, (_cfg, repo_path) in all_repos.items():
-        branch = git.current_branch(repo_path)
+    # First pass: create PRs
+    def _create_pr(repo_name: str, repo_path: Path) -> tuple[str, str | None]:
+        branch, _modified = snapshots[repo_name]
         if branch != feature:
-            console.print(f"    [dim]○[/dim] {repo_name:<20} [dim]skipped (not on feature branch)[/dim]")
-            continue
+            return f"    [dim]○[/dim] {repo_name:<20} [dim]skipped (not on feature branch)[/dim]", None
 
         if not git.has_remote_branch(repo_path, branch):
-            console.print(f"    [dim]○[/dim] {repo_name:<20} [dim]skipped (not pushed to remote)[/dim]")
-            continue
+            return f"    [dim]○[/dim] {repo_name:<20} [dim]skipped (not pushed to remote)[/dim]", None
 
-        cmd = ["gh", "pr", "create", "--title", pr_title]
-        if body:
-            cmd.extend(["--body", body])
-        else:
-            cmd.extend(["--body", f"Part of cross-repo feature: **{feature}**"])
+        cmd = ["gh", "pr", "create", "--title", pr_title, "--body", pr_body]
         if draft:
             cmd.append("--draft")
 
@@ -344,44 +357,49 @@ def pr_cmd(
         )
         if result.returncode == 0:
             pr_url = result.stdout.strip()
+            return f"    [green]✓[/green] {repo_name:<20} {pr_url}", pr_url
+
+        err = result.stderr.strip()
+        # gh returns non-zero if PR already exists
+        if "already exists" in err:
+            # Try to get existing PR URL
+            view_result = subprocess.run(
+                ["gh", "pr", "view", "--json", "url", "-q", ".url"],
+                cwd=repo_path, capture_output=True, text=True,
+            )
+            if view_result.returncode == 0:
+                pr_url = view_result.stdout.strip()
+                return f"    [yellow]●[/yellow] {repo_name:<20} already exists: {pr_url}", pr_url
+            return f"    [yellow]●[/yellow] {repo_name:<20} PR already exists", None
+        return f"    [red]✗[/red] {repo_name:<20} failed: {err}", None
+
+    created_prs: dict[str, str] = {}  # repo_name -> PR URL
+    paths = {n: p for n, (_c, p) in all_repos.items()}
+    for repo_name, (line, pr_url) in _fan_out(paths, _create_pr):
+        console.print(line)
+        if pr_url:
             created_prs[repo_name] = pr_url
-            console.print(f"    [green]✓[/green] {repo_name:<20} {pr_url}")
-        else:
-            err = result.stderr.strip()
-            # gh returns non-zero if PR already exists
-            if "already exists" in err:
-                # Try to get existing PR URL
-                view_result = subprocess.run(
-                    ["gh", "pr", "view", "--json", "url", "-q", ".url"],
-                    cwd=repo_path, capture_output=True, text=True,
-                )
-                if view_result.returncode == 0:
-                    pr_url = view_result.stdout.strip()
-                    created_prs[repo_name] = pr_url
-                    console.print(f"    [yellow]●[/yellow] {repo_name:<20} already exists: {pr_url}")
-                else:
-                    console.print(f"    [yellow]●[/yellow] {repo_name:<20} PR already exists")
-            else:
-                console.print(f"    [red]✗[/red] {repo_name:<20} failed: {err}")
 
     # Second pass: update each PR body with cross-links
     if len(created_prs) > 1:
         console.print()
-        for repo_name, pr_url in created_prs.items():
-            (_cfg, repo_path) = all_repos[repo_name]
+
+        def _link_siblings(repo_name: str, repo_path: Path) -> None:
             sibling_links = "\n".join(
                 f"- **{other}**: {url}"
                 for other, url in created_prs.items()
                 if other != repo_name
             )
-            updated_body = body or f"Part of cross-repo feature: **{feature}**"
-            updated_body += f"\n\n### Related PRs\n\n{sibling_links}"
+            updated_body = f"{pr_body}\n\n### Related PRs\n\n{sibling_links}"
 
             subprocess.run(
-                ["gh", "pr", "edit", pr_url, "--body", updated_body],
+                ["gh", "pr", "edit", created_prs[repo_name], "--body", updated_body],
                 cwd=repo_path, capture_output=True, text=True,
             )
 
+        for _ in _fan_out({n: paths[n] for n in created_prs}, _link_siblings):
+            pass
+
         console.print("  Cross-repo PR links added to descriptions.")
 
     console.print()
@@ -391,14 +409,13 @@ def pr_cmd(
 def finish_cmd() -> None:
     """Switch all repos back to their default branch and optionally clean up."""
     from cli.main import banner
+    from rich.prompt import Confirm
 
     banner()
 
-    config = load_config()
-    workbench_root = find_workbench_yaml().parent
-    all_repos = _get_app_repos(config, workbench_root)
+    workbench_root, all_repos = _load_app_repos()
 
-    feature = _detect_feature(all_repos, workbench_root)
+    feature, snapshots = _detect_feature(all_repos, workbench_root)
     if not feature:
         console.print("\n  [dim]No feature branch detected.[/dim]\n")
         raise typer.Exit(0)
@@ -406,33 +423,35 @@ def finish_cmd() -> None:
     console.print(f"\n  [bold]→[/bold] Finishing feature [cyan]{feature}[/cyan]\n")
 
     # Build the full list: workbench + app repos
-    all_paths: list[tuple[str, Path]] = [("workbench", workbench_root)]
-    all_paths.extend((name, path) for name, (_cfg, path) in all_repos.items())
+    all_paths: dict[str, Path] = {"workbench": workbench_root}
+    all_paths.update((name, path) for name, (_cfg, path) in all_repos.items())
 
     # Switch repos back to default branch
-    switched: list[tuple[str, Path]] = []
-    for repo_name, repo_path in all_paths:
-        branch = git.current_branch(repo_path)
+    def _switch(repo_name: str, repo_path: Path) -> tuple[str, bool]:
+        branch, _modified = snapshots[repo_name]
         if branch != feature:
-            console.print(f"    [dim]○[/dim] {repo_name:<20} [dim]already on {branch}[/dim]")
-            continue
+            return f"    [dim]○[/dim] {repo_name:<20} [dim]already on {branch}[/dim]", False
 
         default_branch = git.get_default_branch(repo_path)
         result = git.checkout(repo_path, default_branch)
         if result.returncode == 0:
-            console.print(f"    [green]✓[/green] {repo_name:<20} → {default_branch}")
-            switched.append((repo_name, repo_path))
-        else:
-            err = result.stderr.strip()
-            console.print(f"    [red]✗[/red] {repo_name:<20} checkout failed: {err}")
+            return f"    [green]✓[/green] {repo_name:<20} → {default_branch}", True
+        err = result.stderr.strip()
+        return f"    [red]✗[/red] {repo_name:<20} checkout failed: {err}", False
+
+    switched: dict[str, Path] = {}
+    for repo_name, (line, ok) in _fan_out(all_paths, _switch):
+        console.print(line)
+        if ok:
+            switched[repo_name] = all_paths[repo_name]
 
     console.print()
 
     # Offer to delete local branches
     if switched and Confirm.ask("  Delete local feature branches?", default=False):
         console.print()
-        for repo_name, repo_path in switched:
-            result = git.delete_branch(repo_path, feature)
+        deletions = _fan_out(switched, lambda _n, p: git.delete_branch(p, feature))
+        for repo_name, result in deletions:
             if result.returncode == 0:
                 console.print(f"    [green]✓[/green] {repo_name:<20} deleted {feature}")
             else:
@@ -2,22 +2,38 @@
 
 from __future__ import annotations
 
+import atexit
+import contextlib
+import functools
 import importlib.resources
-import shutil
+import os
 import subprocess
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.prompt import Prompt
+from rich.markup import escape
 
 from cli.utils import git
 
 console = Console()
 
+_PIP_LOCK = threading.Lock()
 
-def init_cmd() -> None:
+_PLACEHOLDER = b"{project_name}"
+
+
+def init_cmd(
+    workers: int = typer.Option(8, "--workers", "-w", help="Repos to clone and install in parallel."),
+    shallow: bool = typer.Option(
+        True, "--shallow/--full-history", help="Clone only the latest commit (default) or full history."
+    ),
+) -> None:
     """Clone all repos defined in workbench.yaml, or scaffold a new workbench."""
     from cli.main import banner, state
 
@@ -26,7 +42,7 @@ def init_cmd() -> None:
     try:
         from cli.utils.config import find_workbench_yaml
         find_workbench_yaml()
-        _init_existing(state)
+        _init_existing(state, max(1, workers), shallow)
     except FileNotFoundError:
         _scaffold_new(state)
 
@@ -37,40 +53,57 @@ def _scaffold_new(state: object) -> None:
 
     console.print("  [bold yellow]No workbench.yaml found.[/bold yellow] Creating a new workbench...\n")
 
+    from rich.prompt import Prompt
+
     project_name = Prompt.ask("  [bold]Project name[/bold]", default=cwd.name)
 
-    scaffold_dir = Path(__file__).parent.parent / "scaffold"
-    if not scaffold_dir.exists():
+    scaffold_dir = _scaffold_root()
+    if scaffold_dir is None:
         console.print("  [red]✗[/red] Scaffold templates not found. Is the workbench package installed correctly?\n")
         raise typer.Exit(1)
 
     created: list[str] = []
+    # One directory read up front instead of an exists() per top-level file
+    existing = set(os.listdir(cwd))
 
     config_dest = cwd / "workbench.yaml"
     _copy_template(scaffold_dir / "workbench.yaml", config_dest, project_name)
     created.append("workbench.yaml")
+    # A nested workbench.yaml now shadows any parent one found earlier
+    from cli.utils.config import invalidate_root_cache
+    invalidate_root_cache()
 
     claude_dest = cwd / "CLAUDE.md"
-    if not claude_dest.exists():
+    if "CLAUDE.md" not in existing:
         _copy_template(scaffold_dir / "CLAUDE.md", claude_dest, project_name)
         created.append("CLAUDE.md")
 
     gitignore_dest = cwd / ".gitignore"
-    if not gitignore_dest.exists():
+    if ".gitignore" not in existing:
         _copy_template(scaffold_dir / "gitignore", gitignore_dest, project_name)
         created.append(".gitignore")
 
     docs_src = scaffold_dir / "docs"
     docs_dest = cwd / "docs"
     if docs_src.exists():
+        existing_docs = {
+            os.path.relpath(os.path.join(dirpath, f), docs_dest)
+            for dirpath, _dirs, files in os.walk(docs_dest)
+            for f in files
+        }
+        pending: list[tuple[Path, Path, Path]] = []
         for src_file in sorted(docs_src.rglob("*")):
             if src_file.is_file():
                 rel = src_file.relative_to(docs_src)
-                dest_file = docs_dest / rel
-                if not dest_file.exists():
-                    dest_file.parent.mkdir(parents=True, exist_ok=True)
-                    _copy_template(src_file, dest_file, project_name)
-                    created.append(f"docs/{rel}")
+                if str(rel) not in existing_docs:
+                    pending.append((src_file, docs_dest / rel, rel))
+
+        # Create each destination directory once rather than once per file
+        for parent in sorted({dest_file.parent for _, dest_file, _ in pending}):
+            parent.mkdir(parents=True, exist_ok=True)
+        for src_file, dest_file, rel in pending:
+            _copy_template(src_file, dest_file, project_name, mkdir=False)
+            created.append(f"docs/{rel}")
 
     repos_dir = cwd / "repos"
     repos_dir.mkdir(exist_ok=True)
@@ -92,20 +125,45 @@ def _scaffold_new(state: object) -> None:
     console.print()
 
 
-def _copy_template(src: Path, dest: Path, project_name: str) -> None:
-    """Copy a scaffold template, replacing {project_name} placeholders."""
-    content = src.read_text()
-    content = content.replace("{project_name}", project_name)
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    dest.write_text(content)
+def _copy_template(src: Path, dest: Path, project_name: str, *, mkdir: bool = True) -> None:
+    """Copy a scaffold template, replacing {project_name} placeholders.
+
+    Works on raw bytes; files without a placeholder are written back as-is.
+    """
+    content = _load_scaffold(src)
+    if _PLACEHOLDER in content:
+        content = content.replace(_PLACEHOLDER, project_name.encode())
+    if mkdir:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+    dest.write_bytes(content)
+
 
+@functools.cache
+def _scaffold_root() -> Optional[Path]:
+    """Return a filesystem path to the bundled scaffold templates, or None.
 
-def _init_existing(state: object) -> None:
+    Resolved once per process. For zipped installs the tree is extracted on
+    first use and kept until exit.
+    """
+    resource = importlib.resources.files("cli") / "scaffold"
+    if not resource.is_dir():
+        return None
+    stack = contextlib.ExitStack()
+    atexit.register(stack.close)
+    return stack.enter_context(importlib.resources.as_file(resource))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_scaffold(path: Path) -> bytes:
+    """Return a scaffold file's bytes, read once per process."""
+    return path.read_bytes()
+
+
+def _init_existing(state: object, workers: int, shallow: bool) -> None:
     """Clone all repos defined in workbench.yaml and run discovery."""
-    from cli.utils.config import load_config, find_workbench_yaml
+    from cli.utils.config import get_workbench_context
 
-    config = load_config()
-    workbench_root = find_workbench_yaml().parent
+    config, workbench_root = get_workbench_context()
 
     if not config.repos:
         console.print("  [yellow]No repos defined in workbench.yaml.[/yellow]")
@@ -118,6 +176,9 @@ def _init_existing(state: object) -> None:
     cloned = 0
     skipped = 0
 
+    # Report repos that need no clone first, then clone the rest concurrently
+    to_clone: dict[str, tuple[str, Path, str, Optional[int]]] = {}
+    lines: list[str] = []
     for name, repo_cfg in config.repos.items():
         url = repo_cfg.url
         rel_path = repo_cfg.path or f"repos/{name}"
@@ -125,57 +186,83 @@ def _init_existing(state: object) -> None:
 
         if dest.exists() and any(dest.iterdir()):
             if not state.quiet:
-                console.print(f"    [green]✓[/green] {name:<20} [dim]already cloned → {rel_path}[/dim]")
+                lines.append(f"    [green]✓[/green] {name:<20} [dim]already cloned → {rel_path}[/dim]")
             skipped += 1
             continue
 
         if not url:
-            console.print(f"    [yellow]○[/yellow] {name:<20} [dim]no URL configured — skipped[/dim]")
+            lines.append(f"    [yellow]○[/yellow] {name:<20} [dim]no URL configured — skipped[/dim]")
             continue
 
-        if state.verbose:
-            console.print(f"    [dim]  git clone {url} {dest}[/dim]")
+        # A per-repo clone_depth wins over --shallow/--full-history; 0 means full history
+        depth = repo_cfg.clone_depth if repo_cfg.clone_depth is not None else (1 if shallow else 0)
 
-        try:
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            git.clone(url, dest)
-            console.print(f"    [green]✓[/green] {name:<20} [dim]cloned → {rel_path}[/dim]")
-            cloned += 1
-        except subprocess.CalledProcessError as exc:
-            console.print(f"    [red]✗[/red] {name:<20} [red]clone failed[/red]")
-            if state.verbose and exc.stderr:
-                console.print(f"      [dim]{exc.stderr.strip()}[/dim]")
+        if state.verbose:
+            lines.append(f"    [dim]  git clone {url} {dest}[/dim]")
+        to_clone[name] = (url, dest, rel_path, depth)
+
+    # Everything known before the first clone goes out in one write; clone results stream below
+    if lines:
+        console.print("\n".join(lines))
+
+    if to_clone:
+        with ThreadPoolExecutor(max_workers=min(workers, len(to_clone))) as pool:
+            future_to_name = {
+                pool.submit(_clone, url, dest, depth): name
+                for name, (url, dest, _rel, depth) in to_clone.items()
+            }
+            # Report each clone as it finishes
+            for future in as_completed(future_to_name):
+                name = future_to_name[future]
+                rel_path = to_clone[name][2]
+                try:
+                    future.result()
+                    console.print(f"    [green]✓[/green] {name:<20} [dim]cloned → {rel_path}[/dim]")
+                    cloned += 1
+                except subprocess.CalledProcessError as exc:
+                    console.print(f"    [red]✗[/red] {name:<20} [red]clone failed[/red]")
+                    if state.verbose and exc.stderr:
+                        console.print(f"      [dim]{exc.stderr.strip()}[/dim]")
 
     elapsed = time.monotonic() - start_time
 
     console.print("\n  [bold]→[/bold] Installing dependencies...\n")
 
+    to_install: dict[str, Path] = {}
     for name, repo_cfg in config.repos.items():
-        rel_path = repo_cfg.path or f"repos/{name}"
-        dest = workbench_root / rel_path
-
-        if not dest.exists():
-            continue
-
-        installed = _install_deps(dest, name, state.verbose)
-        if installed:
-            console.print(f"    [green]✓[/green] {name:<20} [dim]dependencies installed[/dim]")
-        else:
-            console.print(f"    [dim]○[/dim] {name:<20} [dim]no dependency file detected[/dim]")
+        dest = workbench_root / (repo_cfg.path or f"repos/{name}")
+        if dest.exists():
+            to_install[name] = dest
+
+    # Verbose installs print straight to the terminal, so run them one at a time
+    install_workers = 1 if state.verbose else min(workers, len(to_install))
+    if to_install:
+        with ThreadPoolExecutor(max_workers=install_workers) as pool:
+            future_to_name = {
+                pool.submit(_install_deps, dest, name, state.verbose): name
+                for name, dest in to_install.items()
+            }
+            for future in as_completed(future_to_name):
+                name = future_to_name[future]
+                if future.result():
+                    console.print(f"    [green]✓[/green] {name:<20} [dim]dependencies installed[/dim]")
+                else:
+                    console.print(f"    [dim]○[/dim] {name:<20} [dim]no dependency file detected[/dim]")
 
     console.print("\n  [bold]→[/bold] Running discovery...\n")
 
     try:
         from cli.commands.discover import discover
-        discover(repo=None, dry_run=False, verbose=state.verbose, quiet=state.quiet)
-    except (ImportError, Exception):
-        result = subprocess.run(
-            ["workbench", "discover"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0 and state.verbose:
-            console.print(f"    [dim]Discovery skipped (command not available yet)[/dim]")
+    except ImportError:
+        console.print("    [dim]Discovery skipped (command not available yet)[/dim]")
+    else:
+        try:
+            discover(
+                repo=None, dry_run=False, verbose=state.verbose, quiet=state.quiet, jobs=0, refresh=False,
+            )
+        except Exception as exc:
+            console.print(f"    [yellow]○[/yellow] Discovery failed: {exc}")
+            console.print("      [dim]Run [bold]workbench discover[/bold] to retry.[/dim]")
 
     console.print()
     if not state.quiet:
@@ -191,37 +278,74 @@ def _init_existing(state: object) -> None:
     )
 
 
+def _clone(url: str, dest: Path, depth: Optional[int]) -> None:
+    """Clone *url* into *dest*, creating parent directories first.
+
+    A *depth* of 0 or None clones full history; otherwise the clone is shallow
+    and blobless.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if depth:
+        git.clone(url, dest, depth=depth)
+    else:
+        git.clone(url, dest, depth=None, filter=None)
+
+
 def _install_deps(repo_path: Path, name: str, verbose: bool) -> bool:
     """Attempt to install dependencies for a repo. Returns True if something was installed."""
-    if (repo_path / "package.json").exists():
-        lock = "package-lock.json" if (repo_path / "package-lock.json").exists() else None
-        cmd = "npm ci" if lock else "npm install"
-        if (repo_path / "yarn.lock").exists():
+    # One readdir answers every probe below
+    with os.scandir(repo_path) as it:
+        files = {entry.name for entry in it if not entry.is_dir()}
+
+    if "package.json" in files:
+        cmd = "npm ci" if "package-lock.json" in files else "npm install"
+        if "yarn.lock" in files:
             cmd = "yarn install"
-        if (repo_path / "pnpm-lock.yaml").exists():
+        if "pnpm-lock.yaml" in files:
             cmd = "pnpm install"
         _run_install(cmd, repo_path, verbose)
         return True
 
-    if (repo_path / "requirements.txt").exists():
-        _run_install("pip install -r requirements.txt", repo_path, verbose)
+    # pip installs all target the same environment; never run two at once
+    if "requirements.txt" in files:
+        with _PIP_LOCK:
+            _run_install("pip install -r requirements.txt", repo_path, verbose)
         return True
 
-    if (repo_path / "pyproject.toml").exists():
-        _run_install("pip install -e .", repo_path, verbose)
+    if "pyproject.toml" in files:
+        with _PIP_LOCK:
+            _run_install("pip install -e .", repo_path, verbose)
         return True
 
     return False
 
 
 def _run_install(cmd: str, cwd: Path, verbose: bool) -> None:
-    """Run an install command, suppressing output unless verbose."""
-    result = subprocess.run(
+    """Run an install command, suppressing output unless verbose.
+
+    Quiet runs discard stdout and keep only the tail of stderr, which is shown
+    if the install fails.
+    """
+    if verbose:
+        result = subprocess.run(cmd, shell=True, cwd=cwd)
+        if result.returncode != 0:
+            console.print(f"      [dim]install exited with code {result.returncode}[/dim]")
+        return
+
+    proc = subprocess.Popen(
         cmd,
         shell=True,
         cwd=cwd,
-        capture_output=not verbose,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True,
+        errors="replace",
     )
-    if result.returncode != 0 and verbose:
-        console.print(f"      [dim]install exited with code {result.returncode}[/dim]")
+    tail: deque[str] = deque(maxlen=40)
+    for line in proc.stderr:
+        tail.append(line.rstrip())
+    if proc.wait() != 0:
+        detail = escape("\n".join(line for line in tail if line)[-4096:])
+        console.print(f"      [dim]{cwd.name}: install exited with code {proc.returncode}[/dim]")
+        if detail:
+            console.print(f"      [dim]{detail}[/dim]")
@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from rich.console import Console
-from rich.prompt import Prompt
 
 from cli.utils import git
-from cli.utils.config import RepoConfig
+
+if TYPE_CHECKING:
+    from cli.utils.config import RepoConfig
 
 console = Console()
 
@@ -21,12 +22,11 @@ def push_cmd(
 ) -> None:
     """Push changes for one or all repos."""
     from cli.main import banner, state
-    from cli.utils.config import load_config, find_workbench_yaml
+    from cli.utils.config import get_workbench_context
 
     banner()
 
-    config = load_config()
-    workbench_root = find_workbench_yaml().parent
+    config, workbench_root = get_workbench_context()
 
     if repo:
         if repo not in config.repos:
@@ -40,34 +40,42 @@ def push_cmd(
     pushable: list[str] = []
     console.print("  [bold]→[/bold] Repository status:\n")
 
-    for name, repo_cfg in config.repos.items():
-        rel_path = repo_cfg.path or f"repos/{name}"
-        repo_path = workbench_root / rel_path
+    # Collect the status lines and print them together once every repo is checked
+    lines: list[str] = []
 
-        if not repo_path.exists():
-            console.print(f"    [dim]○[/dim] {name:<20} [dim]not cloned[/dim]")
+    cloned = {}
+    for name, repo_cfg in config.repos.items():
+        repo_path = workbench_root / (repo_cfg.path or f"repos/{name}")
+        if repo_path.exists():
+            cloned[name] = repo_path
+    summaries = dict(zip(cloned, git.get_status_summaries(list(cloned.values()))))
+
+    for name in config.repos:
+        info = summaries.get(name)
+        if info is None:
+            lines.append(f"    [dim]○[/dim] {name:<20} [dim]not cloned[/dim]")
             continue
 
-        info = git.get_status_summary(repo_path)
         branch = info["branch"]
 
         if info["dirty"]:
-            console.print(
+            lines.append(
                 f"    [yellow]●[/yellow] {name:<20} [cyan]{branch}[/cyan]  "
                 f"[yellow]{info['modified_count']} uncommitted[/yellow]"
             )
         elif info["ahead"]:
-            console.print(
+            lines.append(
                 f"    [green]↑[/green] {name:<20} [cyan]{branch}[/cyan]  "
                 f"[green]{info['ahead']} ahead[/green]"
             )
             pushable.append(name)
         else:
-            console.print(
+            lines.append(
                 f"    [dim]✓[/dim] {name:<20} [cyan]{branch}[/cyan]  [dim]up to date[/dim]"
             )
 
-    console.print()
+    lines.append("")
+    console.print("\n".join(lines))
 
     if not pushable:
         console.print("  [dim]Nothing to push.[/dim]\n")
@@ -76,6 +84,8 @@ def push_cmd(
     if all_repos:
         targets = pushable
     else:
+        from rich.prompt import Prompt
+
         choices = ", ".join(pushable)
         console.print(f"  [dim]Repos with commits to push: {choices}[/dim]")
         answer = Prompt.ask(
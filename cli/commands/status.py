@@ -2,11 +2,8 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-
 import typer
-from rich.console import Console
-from rich.table import Table
+from rich.console import Console, Group, NewLine
 
 from cli.utils import git
 from cli.utils.process import ProcessManager
@@ -16,13 +13,14 @@ console = Console()
 
 def status_cmd() -> None:
     """Show repo and service status dashboard."""
+    from rich.table import Table
+
     from cli.main import banner, state
-    from cli.utils.config import load_config, find_workbench_yaml
+    from cli.utils.config import get_workbench_context
 
     banner()
 
-    config = load_config()
-    workbench_root = find_workbench_yaml().parent
+    config, workbench_root = get_workbench_context()
 
     if not config.repos:
         console.print("  [yellow]No repos defined in workbench.yaml[/yellow]\n")
@@ -42,16 +40,20 @@ def status_cmd() -> None:
     repo_table.add_column("Branch", min_width=12)
     repo_table.add_column("Status", min_width=20)
 
+    cloned = {}
     for name, repo_cfg in config.repos.items():
-        rel_path = repo_cfg.path or f"repos/{name}"
-        repo_path = workbench_root / rel_path
-
-        if not repo_path.exists():
+        repo_path = workbench_root / (repo_cfg.path or f"repos/{name}")
+        if repo_path.exists():
+            cloned[name] = repo_path
+    # Gather every repo's git status concurrently; the table is built in config order
+    summaries = dict(zip(cloned, git.get_status_summaries(list(cloned.values()))))
+
+    for name in config.repos:
+        info = summaries.get(name)
+        if info is None:
             repo_table.add_row(name, "[dim]—[/dim]", "[dim]not cloned[/dim]")
             continue
 
-        info = git.get_status_summary(repo_path)
-
         # Build status string
         if info["dirty"]:
             status_str = f"[yellow]●[/yellow] {info['modified_count']} modified"
@@ -69,10 +71,6 @@ def status_cmd() -> None:
 
         repo_table.add_row(name, f"[cyan]{info['branch']}[/cyan]", status_str)
 
-    console.print()
-    console.print(repo_table)
-    console.print()
-
     # -- Services table -----------------------------------------------------
     running_pids = ProcessManager.read_pid_files(workbench_root)
 
@@ -103,5 +101,6 @@ def status_cmd() -> None:
         else:
             svc_table.add_row(name, port_str, "[dim]○ stopped[/dim]")
 
-    console.print(svc_table)
+    # Both tables go out in a single write
     console.print()
+    console.print(Group(repo_table, NewLine(), svc_table, NewLine()))
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import typer
@@ -13,15 +14,16 @@ from cli.utils import git
 console = Console()
 
 
-def sync_cmd() -> None:
+def sync_cmd(
+    workers: int = typer.Option(8, "--workers", "-w", help="Repos to pull in parallel."),
+) -> None:
     """Pull latest changes for all repos."""
     from cli.main import banner, state
-    from cli.utils.config import load_config, find_workbench_yaml
+    from cli.utils.config import get_workbench_context
 
     banner()
 
-    config = load_config()
-    workbench_root = find_workbench_yaml().parent
+    config, workbench_root = get_workbench_context()
 
     if not config.repos:
         console.print("  [yellow]No repos defined in workbench.yaml[/yellow]\n")
@@ -33,40 +35,56 @@ def sync_cmd() -> None:
     success = 0
     errors = 0
 
+    to_pull: dict[str, tuple[str, Path]] = {}
+    lines: list[str] = []
     for name, repo_cfg in config.repos.items():
         rel_path = repo_cfg.path or f"repos/{name}"
         repo_path = workbench_root / rel_path
 
         if not repo_path.exists():
-            console.print(f"    [dim]○[/dim] {name:<20} [dim]not cloned — skipped[/dim]")
+            lines.append(f"    [dim]○[/dim] {name:<20} [dim]not cloned — skipped[/dim]")
             continue
 
         if state.verbose:
-            console.print(f"    [dim]  git pull in {rel_path}[/dim]")
-
-        result = git.pull(repo_path)
-
-        if result.returncode == 0:
-            output = result.stdout.strip()
-            if "Already up to date" in output:
-                console.print(f"    [green]✓[/green] {name:<20} [dim]already up to date[/dim]")
-            else:
-                console.print(f"    [green]✓[/green] {name:<20} updated")
-            success += 1
-        else:
-            errors += 1
-            stderr = result.stderr.strip()
-            if "conflict" in stderr.lower():
-                console.print(f"    [red]✗[/red] {name:<20} [red]merge conflict[/red]")
-                console.print(f"      [dim]Resolve conflicts in {rel_path} and commit[/dim]")
-            elif "no tracking information" in stderr.lower():
-                console.print(
-                    f"    [yellow]○[/yellow] {name:<20} [yellow]no upstream tracking branch[/yellow]"
-                )
-            else:
-                console.print(f"    [red]✗[/red] {name:<20} [red]pull failed[/red]")
-                if state.verbose:
-                    console.print(f"      [dim]{stderr}[/dim]")
+            lines.append(f"    [dim]  git pull in {rel_path}[/dim]")
+        to_pull[name] = (rel_path, repo_path)
+
+    # Everything known before the first pull goes out in one write; pull results stream below
+    if lines:
+        console.print("\n".join(lines))
+
+    if to_pull:
+        with ThreadPoolExecutor(max_workers=min(max(1, workers), len(to_pull))) as pool:
+            future_to_name = {
+                pool.submit(git.pull, repo_path): name for name, (_rel, repo_path) in to_pull.items()
+            }
+            # Report each pull as it finishes, one line per repo
+            for future in as_completed(future_to_name):
+                name = future_to_name[future]
+                rel_path = to_pull[name][0]
+                result = future.result()
+
+                if result.returncode == 0:
+                    output = result.stdout.strip()
+                    if "Already up to date" in output:
+                        console.print(f"    [green]✓[/green] {name:<20} [dim]already up to date[/dim]")
+                    else:
+                        console.print(f"    [green]✓[/green] {name:<20} updated")
+                    success += 1
+                else:
+                    errors += 1
+                    stderr = result.stderr.strip()
+                    if "conflict" in stderr.lower():
+                        console.print(f"    [red]✗[/red] {name:<20} [red]merge conflict[/red]")
+                        console.print(f"      [dim]Resolve conflicts in {rel_path} and commit[/dim]")
+                    elif "no tracking information" in stderr.lower():
+                        console.print(
+                            f"    [yellow]○[/yellow] {name:<20} [yellow]no upstream tracking branch[/yellow]"
+                        )
+                    else:
+                        console.print(f"    [red]✗[/red] {name:<20} [red]pull failed[/red]")
+                        if state.verbose:
+                            console.print(f"      [dim]{stderr}[/dim]")
 
     elapsed = time.monotonic() - start_time
     console.print()
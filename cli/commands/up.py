@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
-import signal
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
+from rich.markup import escape
 
 from cli.utils.process import ProcessManager, ServiceProcess, SERVICE_COLORS
 
+if TYPE_CHECKING:
+    from cli.utils.config import RepoConfig
+
 console = Console()
 
 
@@ -22,21 +25,13 @@ def up_cmd(
 ) -> None:
     """Start services (all or a specific one)."""
     from cli.main import banner, state
-    from cli.utils.config import load_config, find_workbench_yaml
+    from cli.utils.config import get_workbench_context
 
     banner()
 
-    config = load_config()
-    workbench_root = find_workbench_yaml().parent
+    config, workbench_root = get_workbench_context()
     shared_env = config.environment.get("shared_env", {}) if config.environment else {}
 
-    # Filter to startable services (not infrastructure)
-    startable: dict[str, object] = {}
-    for name, repo_cfg in config.repos.items():
-        if repo_cfg.is_infrastructure:
-            continue
-        startable[name] = repo_cfg
-
     if service:
         if service not in config.repos:
             console.print(f"\n  [red]✗[/red] Unknown service: [bold]{service}[/bold]")
@@ -48,14 +43,25 @@ def up_cmd(
                 f"(reference only — cannot be started)\n"
             )
             raise typer.Exit(1)
-        startable = {service: config.repos[service]}
+        candidates = {service: config.repos[service]}
+    else:
+        candidates = config.repos
 
-    if not startable:
+    # One pass: skip infrastructure, note missing start commands, resolve the rest
+    startable: list[tuple[str, RepoConfig, Path]] = []
+    missing_cmd: list[str] = []
+    for name, repo_cfg in candidates.items():
+        if repo_cfg.is_infrastructure:
+            continue
+        if not repo_cfg.start_command:
+            missing_cmd.append(name)
+            continue
+        startable.append((name, repo_cfg, workbench_root / (repo_cfg.path or f"repos/{name}")))
+
+    if not startable and not missing_cmd:
         console.print("  [yellow]No startable services found.[/yellow]\n")
         raise typer.Exit(1)
 
-    # Check all services have a start command
-    missing_cmd = [n for n, c in startable.items() if not c.start_command]
     if missing_cmd:
         console.print("  [red]✗[/red] Missing start commands:\n")
         for name in missing_cmd:
@@ -68,23 +74,20 @@ def up_cmd(
 
     # Build process manager
     manager = ProcessManager(workbench_root)
-    color_idx = 0
-
-    for name, repo_cfg in startable.items():
-        color = SERVICE_COLORS[color_idx % len(SERVICE_COLORS)]
-        color_idx += 1
-
-        svc = ServiceProcess(
-            name=name,
-            command=repo_cfg.start_command,
-            cwd=workbench_root / (repo_cfg.path or f"repos/{name}"),
-            port=repo_cfg.port,
-            health_check=repo_cfg.health_check,
-            env=shared_env if isinstance(shared_env, dict) else {},
-            color=color,
-            workbench_root=workbench_root,
+    env = shared_env if isinstance(shared_env, dict) else {}
+    for idx, (name, repo_cfg, cwd) in enumerate(startable):
+        manager.add(
+            ServiceProcess(
+                name=name,
+                command=repo_cfg.start_command,
+                cwd=cwd,
+                port=repo_cfg.port,
+                health_check=repo_cfg.health_check,
+                env=env,
+                color=SERVICE_COLORS[idx % len(SERVICE_COLORS)],
+                workbench_root=workbench_root,
+            )
         )
-        manager.add(svc)
 
     # -- Start services with live status ------------------------------------
     console.print("  [bold]→[/bold] Starting services...\n")
@@ -92,22 +95,35 @@ def up_cmd(
     for name, svc in manager.services.items():
         port_str = f":{svc.port}" if svc.port else ""
         console.print(f"    {name:<20} [cyan]●[/cyan] starting on {port_str} ...")
-        svc.start()
 
-    # Wait for health
-    console.print()
     all_healthy = True
-    for name, svc in manager.services.items():
-        healthy = svc.wait_healthy(timeout=30)
-        if healthy:
-            console.print(f"    {name:<20} [green]✓[/green] healthy")
-        else:
-            if svc.is_running():
-                console.print(f"    {name:<20} [yellow]●[/yellow] running [dim](health check inconclusive)[/dim]")
+    with ThreadPoolExecutor(max_workers=len(manager.services)) as pool:
+        # Spawn every service at once, then poll them all and report each as it settles.
+        # One failed spawn doesn't stop the others, and whatever did start is
+        # recorded before any error propagates so `workbench down` can stop it.
+        try:
+            start_errors = dict(zip(manager.services, pool.map(_start, manager.services.values())))
+        finally:
+            manager.save_pids()
+
+        console.print()
+        future_to_name = {
+            pool.submit(svc.wait_healthy, timeout=30): name for name, svc in manager.services.items()
+        }
+        for future in as_completed(future_to_name):
+            name = future_to_name[future]
+            svc = manager.services[name]
+            if future.result():
+                console.print(f"    {name:<20} [green]✓[/green] healthy")
             else:
-                all_healthy = False
-                console.print(f"    {name:<20} [red]✗[/red] failed to start")
-                _show_error_panel(name, svc)
+                if svc.is_running():
+                    console.print(f"    {name:<20} [yellow]●[/yellow] running [dim](health check inconclusive)[/dim]")
+                else:
+                    all_healthy = False
+                    console.print(f"    {name:<20} [red]✗[/red] failed to start")
+                    if start_errors[name] is not None:
+                        console.print(f"      [dim]{escape(str(start_errors[name]))}[/dim]")
+                    _show_error_panel(name, svc)
 
     if not all_healthy:
         console.print()
@@ -119,9 +135,8 @@ def up_cmd(
     )
     console.print("  [dim]─── logs ─────────────────────────────────────────────[/dim]")
 
-    # Start log streaming threads
-    for svc in manager.services.values():
-        svc.start_log_thread(console)
+    # Stream all service logs from one thread
+    manager.start_log_multiplexer(console)
 
     # -- Wait for Ctrl+C ----------------------------------------------------
     def _shutdown(signum, frame):
@@ -132,6 +147,8 @@ def up_cmd(
         console.print()
         sys.exit(0)
 
+    import signal
+
     signal.signal(signal.SIGINT, _shutdown)
     signal.signal(signal.SIGTERM, _shutdown)
 
@@ -147,8 +164,19 @@ def up_cmd(
     manager.stop_all()
 
 
+def _start(svc: ServiceProcess) -> OSError | None:
+    """Start *svc*, returning the error instead of raising if it can't be spawned."""
+    try:
+        svc.start()
+    except OSError as exc:
+        return exc
+    return None
+
+
 def _show_error_panel(name: str, svc: ServiceProcess) -> None:
     """Show an actionable error panel for a failed service."""
+    from rich.panel import Panel
+
     lines = []
     port = svc.port
     if port:
@@ -68,7 +68,7 @@ app.add_typer(feature_app)
 try:
     from cli.commands import discover
     app.command(name="discover", help="Auto-detect repo configurations.")(discover.discover)
-except Exception:
+except ImportError:
     pass  # discover command registered when available
 
 
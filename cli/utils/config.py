@@ -7,13 +7,24 @@ Other CLI commands import from this module to read/write config.
 
 from __future__ import annotations
 
+import copy
+import functools
 import os
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# libyaml's C loader and dumper are several times faster; fall back when
+# PyYAML was built without it
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
 
 # ---------------------------------------------------------------------------
 # Data models
@@ -36,6 +47,7 @@ class RepoConfig:
     health_check: str | None = None
     install_command: str | None = None
     env_file: str | None = None
+    clone_depth: int | None = None  # 0 = full history; None = follow `workbench init`
 
     @property
     def is_infrastructure(self) -> bool:
@@ -51,16 +63,72 @@ class RepoConfig:
         return _workbench_root() / self.path
 
 
+class RepoMap(MutableMapping[str, RepoConfig]):
+    """Name → RepoConfig mapping that builds each RepoConfig on first access.
+
+    Holds the raw YAML dicts from workbench.yaml; commands that touch one
+    repo, or only check names, never pay for the rest.
+    """
+
+    def __init__(self, raw: dict[str, Any] | None = None) -> None:
+        self._raw: dict[str, Any] = dict(raw or {})
+        self._materialized: dict[str, RepoConfig] = {}
+
+    @classmethod
+    def from_configs(cls, repos: dict[str, RepoConfig]) -> RepoMap:
+        repo_map = cls()
+        for name, repo in repos.items():
+            repo_map[name] = repo
+        return repo_map
+
+    def type_of(self, name: str) -> str:
+        """Return a repo's type without building its RepoConfig."""
+        if name in self._materialized:
+            return self._materialized[name].type
+        return (self._raw[name] or {}).get("type", "service")
+
+    def __getitem__(self, name: str) -> RepoConfig:
+        repo = self._materialized.get(name)
+        if repo is None:
+            repo = _repo_from_dict(name, self._raw[name] or {})
+            self._materialized[name] = repo
+        return repo
+
+    def __setitem__(self, name: str, repo: RepoConfig) -> None:
+        self._raw.setdefault(name, None)
+        self._materialized[name] = repo
+
+    def __delitem__(self, name: str) -> None:
+        del self._raw[name]
+        self._materialized.pop(name, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._raw
+
+    def __repr__(self) -> str:
+        return f"RepoMap({list(self._raw)!r})"
+
+
 @dataclass
 class WorkbenchConfig:
     """Top-level workbench configuration."""
 
     name: str = "my-workbench"
     version: str = "0.1.0"
-    repos: dict[str, RepoConfig] = field(default_factory=dict)
+    repos: RepoMap = field(default_factory=RepoMap)
     services: dict[str, Any] = field(default_factory=dict)
     environment: dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.repos, RepoMap):
+            self.repos = RepoMap.from_configs(self.repos)
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -68,6 +136,10 @@ class WorkbenchConfig:
 
 _CONFIG_FILENAME = "workbench.yaml"
 
+# Parsed configs by resolved path: (st_mtime_ns, st_size, config), oldest first
+_CONFIG_CACHE: OrderedDict[Path, tuple[int, int, WorkbenchConfig]] = OrderedDict()
+_CONFIG_CACHE_SIZE = 32
+
 
 def _workbench_root() -> Path:
     """Return the workbench root directory (where workbench.yaml lives)."""
@@ -90,31 +162,39 @@ def _repo_from_dict(name: str, data: dict[str, Any]) -> RepoConfig:
         health_check=data.get("health_check"),
         install_command=data.get("install_command"),
         env_file=data.get("env_file"),
+        clone_depth=_to_int_or_none(data.get("clone_depth")),
     )
 
 
 def _repo_to_dict(repo: RepoConfig) -> dict[str, Any]:
-    """Serialize a RepoConfig back to a plain dict for YAML output."""
-    d: dict[str, Any] = {}
-    d["url"] = repo.url
-    d["path"] = repo.path
-    d["description"] = repo.description
-    if repo.type != "service":
-        d["type"] = repo.type
-    d["start_command"] = repo.start_command
-    d["port"] = repo.port
-    d["language"] = repo.language
-    d["framework"] = repo.framework
-    d["dependencies"] = repo.dependencies
-    d["health_check"] = repo.health_check
-    d["install_command"] = repo.install_command
-    d["env_file"] = repo.env_file
-    return d
+    """Serialize a RepoConfig back to a plain dict for YAML output.
+
+    Unset (None) fields and the default type are left out; _repo_from_dict
+    fills them back in on load.
+    """
+    fields = (
+        ("url", repo.url),
+        ("path", repo.path),
+        ("description", repo.description),
+        ("type", None if repo.type == "service" else repo.type),
+        ("start_command", repo.start_command),
+        ("port", repo.port),
+        ("language", repo.language),
+        ("framework", repo.framework),
+        ("dependencies", repo.dependencies),
+        ("health_check", repo.health_check),
+        ("install_command", repo.install_command),
+        ("env_file", repo.env_file),
+        ("clone_depth", repo.clone_depth),
+    )
+    return {key: value for key, value in fields if value is not None}
 
 
 def _to_int_or_none(val: Any) -> int | None:
     if val is None:
         return None
+    if type(val) is int:  # YAML already parsed it; bools still go through int()
+        return val
     try:
         return int(val)
     except (ValueError, TypeError):
@@ -128,9 +208,22 @@ def _to_int_or_none(val: Any) -> int | None:
 def find_workbench_yaml(start: Path | None = None) -> Path:
     """Walk upward from *start* (default: cwd) to find workbench.yaml.
 
-    Raises FileNotFoundError if not found.
+    Raises FileNotFoundError if not found. Successful lookups are cached per
+    starting directory; call invalidate_root_cache() after creating a
+    workbench.yaml.
     """
-    current = (start or Path.cwd()).resolve()
+    return _find_workbench_yaml(str((start or Path.cwd()).resolve()))
+
+
+def invalidate_root_cache() -> None:
+    """Forget cached find_workbench_yaml() results."""
+    _find_workbench_yaml.cache_clear()
+
+
+@functools.lru_cache(maxsize=8)
+def _find_workbench_yaml(start_dir: str) -> Path:
+    current = Path(start_dir)
+    start = current
     while True:
         candidate = current / _CONFIG_FILENAME
         if candidate.is_file():
@@ -140,22 +233,41 @@ def find_workbench_yaml(start: Path | None = None) -> Path:
             break
         current = parent
     raise FileNotFoundError(
-        f"Could not find {_CONFIG_FILENAME} in {start or Path.cwd()} or any parent directory"
+        f"Could not find {_CONFIG_FILENAME} in {start} or any parent directory"
     )
 
 
 def load_config(path: Path | None = None) -> WorkbenchConfig:
     """Load and parse workbench.yaml into a WorkbenchConfig.
 
-    If *path* is None, searches upward from cwd.
+    If *path* is None, searches upward from cwd. The parsed file is cached
+    until its mtime or size changes; each call returns a fresh copy that
+    callers are free to mutate.
     """
-    config_path = path if path else find_workbench_yaml()
+    config_path = Path(path if path else find_workbench_yaml()).resolve()
+    st = os.stat(config_path)
+
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        _CONFIG_CACHE.move_to_end(config_path)
+        return copy.deepcopy(cached[2])
+
+    config = _parse_config(config_path)
+    _CONFIG_CACHE[config_path] = (st.st_mtime_ns, st.st_size, config)
+    _CONFIG_CACHE.move_to_end(config_path)
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+        _CONFIG_CACHE.popitem(last=False)
+    return copy.deepcopy(config)
+
+
+def _parse_config(config_path: Path) -> WorkbenchConfig:
     with open(config_path, "r") as f:
-        raw = yaml.safe_load(f) or {}
+        raw = yaml.load(f, Loader=_YamlLoader) or {}
 
     wb = raw.get("workbench", {})
     repos_raw = raw.get("repos", {})
-    repos = {name: _repo_from_dict(name, data or {}) for name, data in repos_raw.items()}
+    # RepoConfigs are built lazily, on first access to each repo
+    repos = RepoMap(repos_raw)
 
     return WorkbenchConfig(
         name=wb.get("name", "my-workbench"),
@@ -172,6 +284,9 @@ def save_config(config: WorkbenchConfig, path: Path | None = None) -> Path:
     Returns the path that was written to.
     """
     config_path = path if path else find_workbench_yaml()
+    # Drop the cached parse up front; a write within the same mtime tick and
+    # at the same size would otherwise look unchanged
+    _CONFIG_CACHE.pop(Path(config_path).resolve(), None)
 
     data: dict[str, Any] = {
         "workbench": {
@@ -184,11 +299,19 @@ def save_config(config: WorkbenchConfig, path: Path | None = None) -> Path:
     }
 
     with open(config_path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        yaml.dump(
+            data, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False, allow_unicode=True
+        )
 
     return config_path
 
 
+def get_workbench_context() -> tuple[WorkbenchConfig, Path]:
+    """Return the loaded config and the workbench root directory."""
+    config_path = find_workbench_yaml()
+    return load_config(config_path), config_path.parent
+
+
 def get_repo(config: WorkbenchConfig, name: str) -> RepoConfig:
     """Get a single repo by logical name. Raises KeyError if not found."""
     if name not in config.repos:
@@ -198,7 +321,8 @@ def get_repo(config: WorkbenchConfig, name: str) -> RepoConfig:
 
 def get_startable_repos(config: WorkbenchConfig) -> list[RepoConfig]:
     """Return repos that can be started (excludes infrastructure repos)."""
-    return [r for r in config.repos.values() if not r.is_infrastructure]
+    repos = config.repos
+    return [repos[name] for name in repos if repos.type_of(name) != "infrastructure"]
 
 
 def get_all_repos(config: WorkbenchConfig) -> list[RepoConfig]:
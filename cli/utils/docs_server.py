@@ -0,0 +1,413 @@
+"""Markdown rendering and the HTTP server behind `workbench docs --serve`.
+
+Kept apart from cli/commands/docs.py so that opening the docs locally
+doesn't pay for importing http.server.
+"""
+
+from __future__ import annotations
+
+import functools
+import gzip
+import http.server
+import os
+import re
+import urllib.parse
+from pathlib import Path
+
+_CSS = """\
+body {
+  max-width: 800px; margin: 40px auto; padding: 0 20px;
+  font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif;
+  color: #1a1a2e; background: #fafbfc; line-height: 1.6; font-size: 16px;
+}
+h1, h2, h3, h4 { color: #0f172a; margin-top: 1.8em; }
+h1 { border-bottom: 2px solid #e2e8f0; padding-bottom: 0.3em; }
+h2 { border-bottom: 1px solid #e2e8f0; padding-bottom: 0.2em; }
+a { color: #2563eb; text-decoration: none; }
+a:hover { text-decoration: underline; }
+code {
+  background: #f1f5f9; padding: 0.15em 0.4em; border-radius: 4px;
+  font-size: 0.9em; font-family: "SF Mono", Menlo, monospace;
+}
+pre {
+  background: #1e293b; color: #e2e8f0; padding: 16px; border-radius: 8px;
+  overflow-x: auto; line-height: 1.5;
+}
+pre code { background: none; padding: 0; color: inherit; }
+table {
+  border-collapse: collapse; width: 100%; margin: 1em 0;
+}
+th, td {
+  border: 1px solid #e2e8f0; padding: 8px 12px; text-align: left;
+}
+th { background: #f1f5f9; font-weight: 600; }
+blockquote {
+  border-left: 4px solid #2563eb; margin: 1em 0; padding: 0.5em 1em;
+  background: #eff6ff; color: #1e40af;
+}
+nav { background: #f1f5f9; padding: 12px 16px; border-radius: 8px; margin-bottom: 2em; font-size: 0.9em; }
+nav a { margin-right: 8px; }
+hr { border: none; border-top: 1px solid #e2e8f0; margin: 2em 0; }
+"""
+
+# The fixed parts of every page (including the stylesheet), encoded once.
+# A page is PREFIX + title + HEAD_END + nav + body + SUFFIX.
+_PAGE_PREFIX = (
+    '<!DOCTYPE html>\n<html><head>\n'
+    '<meta charset="utf-8"><meta name="viewport" content="width=device-width, initial-scale=1">\n'
+    '<title>'
+).encode("utf-8")
+_PAGE_HEAD_END = f" — Workbench Docs</title>\n<style>{_CSS}</style>\n</head><body>\n".encode("utf-8")
+_PAGE_SUFFIX = b"\n</body></html>"
+
+# Block patterns used by the markdown renderer, compiled once at import
+_RE_HEADING = re.compile(r"(#{1,4}) (.+)$")
+_RE_HR = re.compile(r"---+$")
+_RE_TABLE_SEP = re.compile(r"\|[-| :]+\|\s*$")
+_RE_ORDERED_ITEM = re.compile(r"\d+\. (.+)$")
+
+# Escapes code in one pass, rather than one replace() per character
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# ---------------------------------------------------------------------------
+# Markdown rendering
+# ---------------------------------------------------------------------------
+
+def _render_markdown(text: str) -> str:
+    """Convert markdown to HTML in a single pass over its lines.
+
+    Each line is dispatched on its first non-space character to a block
+    handler; anything no handler claims is paragraph text.
+    """
+    lines = text.splitlines()
+    out: list[str] = []
+    paragraph: list[str] = []
+    i = 0
+
+    while i < len(lines):
+        stripped = lines[i].lstrip()
+        if not stripped:
+            _flush_paragraph(paragraph, out)
+            i += 1
+            continue
+
+        handler = _BLOCK_HANDLERS.get(stripped[0])
+        block: list[str] = []
+        end = handler(lines, i, block) if handler else None
+        if end is None:
+            paragraph.append(stripped)
+            i += 1
+        else:
+            _flush_paragraph(paragraph, out)
+            out.extend(block)
+            i = end
+
+    _flush_paragraph(paragraph, out)
+    return "\n".join(out)
+
+
+def _flush_paragraph(paragraph: list[str], out: list[str]) -> None:
+    if paragraph:
+        text = "\n".join(paragraph)
+        out.append(f"<p>{_render_inline(text)}</p>")
+        paragraph.clear()
+
+
+# Block handlers take the document's lines and the index of the line to
+# start from. A handler that recognizes a block appends its HTML to *out*
+# and returns the index just past it; otherwise it returns None.
+
+def _block_fence(lines: list[str], i: int, out: list[str]) -> int | None:
+    if not lines[i].lstrip().startswith("```"):
+        return None
+    end = i + 1
+    while end < len(lines) and not lines[end].lstrip().startswith("```"):
+        end += 1
+    code = _escape_code("\n".join(lines[i + 1:end]).strip("\n"))
+    out.append(f"<pre><code>{code}</code></pre>")
+    return end + 1
+
+
+def _block_heading(lines: list[str], i: int, out: list[str]) -> int | None:
+    match = _RE_HEADING.match(lines[i].lstrip())
+    if not match:
+        return None
+    level = len(match.group(1))
+    out.append(f"<h{level}>{_render_inline(match.group(2))}</h{level}>")
+    return i + 1
+
+
+def _block_quote(lines: list[str], i: int, out: list[str]) -> int | None:
+    quoted: list[str] = []
+    while i < len(lines):
+        line = lines[i].lstrip()
+        if not line.startswith(">"):
+            break
+        quoted.append(_render_inline(line[2:] if line.startswith("> ") else line[1:]))
+        i += 1
+    out.append("<blockquote>\n" + "\n".join(quoted) + "\n</blockquote>")
+    return i
+
+
+def _block_table(lines: list[str], i: int, out: list[str]) -> int | None:
+    # A header row must be followed by a |---|---| separator row
+    if i + 1 >= len(lines) or not _RE_TABLE_SEP.match(lines[i + 1].lstrip()):
+        return None
+
+    cells = _table_cells(lines[i])
+    parts = ["<table><thead><tr>"]
+    parts.extend(f"<th>{cell}</th>" for cell in cells)
+    parts.append("</tr></thead><tbody>")
+    i += 2
+    while i < len(lines) and lines[i].lstrip().startswith("|"):
+        parts.append("<tr>")
+        parts.extend(f"<td>{cell}</td>" for cell in _table_cells(lines[i]))
+        parts.append("</tr>")
+        i += 1
+    parts.append("</tbody></table>")
+    out.append("".join(parts))
+    return i
+
+
+def _table_cells(row: str) -> list[str]:
+    return [_render_inline(cell.strip()) for cell in row.strip().strip("|").split("|")]
+
+
+def _block_dash(lines: list[str], i: int, out: list[str]) -> int | None:
+    if _RE_HR.match(lines[i].strip()):
+        out.append("<hr>")
+        return i + 1
+    return _block_list(lines, i, out)
+
+
+def _block_list(lines: list[str], i: int, out: list[str]) -> int | None:
+    ordered = lines[i].lstrip()[0].isdigit()
+    items: list[str] = []
+    while i < len(lines):
+        item = _list_item(lines[i].lstrip(), ordered)
+        if item is None:
+            break
+        items.append(f"<li>{_render_inline(item)}</li>")
+        i += 1
+    if not items:
+        return None
+    tag = "ol" if ordered else "ul"
+    out.append(f"<{tag}>" + "".join(items) + f"</{tag}>")
+    return i
+
+
+def _list_item(line: str, ordered: bool) -> str | None:
+    """Return the text of a list item line, or None if *line* isn't one."""
+    if ordered:
+        match = _RE_ORDERED_ITEM.match(line)
+        return match.group(1) if match else None
+    if line[:2] in ("- ", "* ") and line[2:].strip():
+        return line[2:]
+    return None
+
+
+_BLOCK_HANDLERS = {
+    "`": _block_fence,
+    "#": _block_heading,
+    ">": _block_quote,
+    "|": _block_table,
+    "-": _block_dash,
+    "*": _block_list,
+    **{digit: _block_list for digit in "0123456789"},
+}
+
+
+def _render_inline(text: str) -> str:
+    """Render inline code, bold, italics and links within a block's text."""
+    out: list[str] = []
+    i = 0
+    while i < len(text):
+        # Copy plain text up to the next character that can open a span
+        nxt = min((pos for pos in (text.find("`", i), text.find("*", i), text.find("[", i)) if pos >= 0),
+                  default=len(text))
+        if nxt > i:
+            out.append(text[i:nxt])
+            i = nxt
+            if i == len(text):
+                break
+
+        span = _inline_span(text, i)
+        if span is None:
+            out.append(text[i])
+            i += 1
+        else:
+            html, i = span
+            out.append(html)
+    return "".join(out)
+
+
+def _inline_span(text: str, i: int) -> tuple[str, int] | None:
+    """Render the span opening at text[i]; return (html, index past it) or None."""
+    char = text[i]
+    if char == "`":
+        end = text.find("`", i + 1)
+        if end > i + 1:
+            return f"<code>{_escape_code(text[i + 1:end])}</code>", end + 1
+    elif text.startswith("**", i):
+        end = text.find("**", i + 2)
+        if end > i + 2:
+            return f"<strong>{_render_inline(text[i + 2:end])}</strong>", end + 2
+    elif char == "*":
+        end = text.find("*", i + 1)
+        if end > i + 1:
+            return f"<em>{_render_inline(text[i + 1:end])}</em>", end + 1
+    elif char == "[":
+        mid = text.find("](", i + 1)
+        end = text.find(")", mid + 2) if mid > i + 1 else -1
+        if end > mid + 2 and "\n" not in text[i:end]:
+            href = text[mid + 2:end]
+            # Rewrite .md links to work in the browser
+            if href.endswith(".md") or ".md#" in href:
+                href = href.replace(".md", "")
+            return f'<a href="{href}">{_render_inline(text[i + 1:mid])}</a>', end + 1
+    return None
+
+
+def _escape_code(code: str) -> str:
+    return code.translate(_HTML_ESCAPE)
+
+
+# ---------------------------------------------------------------------------
+# Docs server
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=128)
+def _render_page(file_path: Path, docs_dir: Path, mtime_ns: int) -> bytes:
+    """Render a markdown file as a complete, encoded HTML page.
+
+    *mtime_ns* is only part of the cache key: editing the file changes it,
+    so the next request re-renders instead of hitting the stale entry.
+    """
+    text = file_path.read_text(encoding="utf-8")
+    body = _render_markdown(text)
+    title = file_path.stem.replace("-", " ").title()
+
+    # Build breadcrumb nav
+    rel = file_path.relative_to(docs_dir)
+    nav = '<nav><a href="/">docs</a>'
+    parts = list(rel.parts)
+    for i, part in enumerate(parts[:-1]):
+        link = "/".join(parts[: i + 1])
+        nav += f' / <a href="/{link}">{part}</a>'
+    nav += f" / {parts[-1]}</nav>"
+
+    return b"".join((
+        _PAGE_PREFIX, title.encode("utf-8"), _PAGE_HEAD_END,
+        nav.encode("utf-8"), b"\n", body.encode("utf-8"), _PAGE_SUFFIX,
+    ))
+
+
+@functools.lru_cache(maxsize=128)
+def _render_page_gzip(file_path: Path, docs_dir: Path, mtime_ns: int) -> bytes:
+    """Gzipped _render_page(), compressed once per file version."""
+    # Level 1 already shrinks HTML several-fold, at a fraction of the CPU of the default
+    return gzip.compress(_render_page(file_path, docs_dir, mtime_ns), compresslevel=1)
+
+
+def _scan_docs(docs_dir: Path) -> dict[str, Path]:
+    """Map every URL path that resolves to a file under *docs_dir* to that file.
+
+    A markdown file is reachable with or without its .md extension; a file
+    whose name matches another's extension-less alias takes precedence.
+    """
+    manifest: dict[str, Path] = {}
+    for dirpath, _dirnames, filenames in os.walk(docs_dir):
+        rel_dir = Path(dirpath).relative_to(docs_dir).as_posix()
+        prefix = "" if rel_dir == "." else f"{rel_dir}/"
+        for filename in filenames:
+            file_path = Path(dirpath, filename)
+            if filename.endswith(".md"):
+                manifest.setdefault(prefix + filename[:-3], file_path)
+            manifest[prefix + filename] = file_path
+    return manifest
+
+
+class _MarkdownHandler(http.server.BaseHTTPRequestHandler):
+    """HTTP handler that renders .md files as styled HTML."""
+
+    docs_dir: Path = Path(".")
+    # URL path -> file, built by _scan_docs() when the server starts
+    manifest: dict[str, Path] = {}
+
+    # Buffer writes so the status line, headers and a typical page body go
+    # out together when the request finishes, instead of one send() each
+    wbufsize = 64 * 1024
+
+    def do_GET(self):
+        parsed = urllib.parse.urlparse(self.path)
+        path = urllib.parse.unquote(parsed.path).lstrip("/")
+
+        if path == "" or path.endswith("/"):
+            path += "INDEX"
+
+        file_path = self.manifest.get(path)
+        if file_path is not None:
+            try:
+                body, content_type, encoding = self._load(file_path)
+            except OSError:
+                # Gone since the manifest was built; refresh it and look on disk
+                type(self).manifest = _scan_docs(self.docs_dir)
+            else:
+                self._send_body(body, content_type, encoding)
+                return
+
+        # Not in the manifest (added since startup, or behind a symlinked
+        # directory): try the exact path, then with .md extension. Opening
+        # the file is the existence check.
+        file_path = self.docs_dir / path
+        candidates = [file_path] if file_path.suffix else [file_path, file_path.with_suffix(".md")]
+        for candidate in candidates:
+            try:
+                body, content_type, encoding = self._load(candidate)
+            except OSError:
+                continue
+            self._send_body(body, content_type, encoding)
+            return
+
+        self.send_error(404, f"Not found: {path}")
+
+    def _load(self, file_path: Path) -> tuple[bytes, str, str | None]:
+        """Return (body, content type, content encoding) for *file_path*.
+
+        Raises OSError if the file can't be read.
+        """
+        if file_path.suffix == ".md":
+            mtime_ns = file_path.stat().st_mtime_ns
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                return _render_page_gzip(file_path, self.docs_dir, mtime_ns), "text/html; charset=utf-8", "gzip"
+            return _render_page(file_path, self.docs_dir, mtime_ns), "text/html; charset=utf-8", None
+        return file_path.read_bytes(), "application/octet-stream", None
+
+    def _send_body(self, body: bytes, content_type: str, encoding: str | None = None):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+            self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, fmt, *args):
+        """Suppress default logging."""
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def serve_docs(docs_dir: Path, port: int) -> None:
+    """Serve *docs_dir* on *port* until interrupted.
+
+    Raises OSError if the port can't be bound.
+    """
+    _MarkdownHandler.docs_dir = docs_dir
+    _MarkdownHandler.manifest = _scan_docs(docs_dir)
+    with http.server.ThreadingHTTPServer(("", port), _MarkdownHandler) as httpd:
+        httpd.serve_forever()
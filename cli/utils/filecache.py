@@ -0,0 +1,118 @@
+"""Persistent cache for values derived from files on disk.
+
+Entries live under ~/.cache/workbench/<namespace>/ and are keyed by the
+paths they were derived from. Each entry records the mtime and size of
+those files, plus any extra files the value turned out to depend on, so
+editing any of them invalidates it on the next lookup.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+CACHE_ROOT = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "workbench"
+
+# When set, every lookup misses, so values are recomputed and stored afresh
+_refresh = False
+
+
+def set_refresh(refresh: bool) -> None:
+    """Make load() always miss (True) or behave normally (False)."""
+    global _refresh
+    _refresh = refresh
+
+
+def _entry_path(namespace: str, paths: list[Path]) -> Path:
+    key = "\0".join(str(p) for p in paths)
+    return CACHE_ROOT / namespace / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+
+def _signature(paths: list[Path]) -> list[list[int] | None]:
+    """Return [mtime_ns, size] for each path (None if it does not exist)."""
+    sig: list[list[int] | None] = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            sig.append(None)
+        else:
+            sig.append([st.st_mtime_ns, st.st_size])
+    return sig
+
+
+def load(namespace: str, paths: Iterable[Path]) -> tuple[bool, Any]:
+    """Look up the value cached for *paths*.
+
+    Returns (hit, value); hit is False if there is no entry, any of the
+    files (or the *depends* recorded by store()) changed since it was
+    stored, or set_refresh(True) is in effect.
+    """
+    if _refresh:
+        return False, None
+    paths = list(paths)
+    try:
+        with open(_entry_path(namespace, paths), "rb") as f:
+            entry = json.loads(f.read())
+    except (OSError, ValueError):
+        return False, None
+    if entry.get("signature") != _signature(paths):
+        return False, None
+    depends = [Path(p) for p in entry.get("depends", ())]
+    if entry.get("depends_signature", []) != _signature(depends):
+        return False, None
+    return True, entry.get("value")
+
+
+def store(namespace: str, paths: Iterable[Path], value: Any, depends: Iterable[Path] = ()) -> None:
+    """Cache *value* against the current state of *paths*. Failures are ignored.
+
+    *depends* lists further files the value was derived from; unlike *paths*
+    they are not part of the key, so they need not be known before load().
+    """
+    paths = list(paths)
+    depends = list(dict.fromkeys(depends))
+    dest = _entry_path(namespace, paths)
+    data = json.dumps({
+        "signature": _signature(paths),
+        "depends": [str(p) for p in depends],
+        "depends_signature": _signature(depends),
+        "value": value,
+    }).encode()
+    try:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=dest.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, dest)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+
+
+def cached(namespace: str, paths_of: Callable[..., Iterable[Path]]) -> Callable:
+    """Decorator: cache a function's result against the files it reads.
+
+    *paths_of* is called with the same arguments as the wrapped function and
+    returns the files its result depends on. Results must be JSON-serializable.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            paths = list(paths_of(*args, **kwargs))
+            hit, value = load(namespace, paths)
+            if hit:
+                return value
+            value = func(*args, **kwargs)
+            store(namespace, paths, value)
+            return value
+        return wrapper
+    return decorator
@@ -2,22 +2,62 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import shlex
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 
-def _run(args: list[str], cwd: Path, *, check: bool = True) -> subprocess.CompletedProcess[str]:
+def _run(
+    args: list[str], cwd: Path, *, check: bool = True, env: Optional[dict[str, str]] = None
+) -> subprocess.CompletedProcess[str]:
     """Run a git command in *cwd* and return the result."""
     return subprocess.run(
         args,
-        cwd=cwd,
+        cwd=str(cwd),
         capture_output=True,
         text=True,
         check=check,
+        env=env,
     )
 
 
+_SSH_SOCKET_DIR = Path.home() / ".ssh" / "sockets"
+
+
+@functools.lru_cache(maxsize=None)
+def _remote_env() -> Optional[dict[str, str]]:
+    """Return an environment that shares one SSH connection per host, or None.
+
+    Clones and pulls against the same host then pay for the SSH handshake
+    once; the master connection lingers for 60s after the last use. Left
+    alone (None) if the user already configures ssh for git, or on Windows.
+    """
+    if os.name == "nt" or "GIT_SSH_COMMAND" in os.environ or "GIT_SSH" in os.environ:
+        return None
+    configured = _run(["git", "config", "--get", "core.sshCommand"], cwd=Path.cwd(), check=False)
+    if configured.stdout.strip():
+        return None
+    try:
+        _SSH_SOCKET_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    except OSError:
+        return None
+    # %C is a hash of the connection details, so the socket path stays short
+    # enough for the Unix socket limit whatever the host and user names are.
+    # Quoted twice: ssh splits option values on whitespace, and git runs
+    # GIT_SSH_COMMAND through the shell.
+    control_path = shlex.quote(f'ControlPath="{_SSH_SOCKET_DIR / "wb-%C"}"')
+    return {
+        **os.environ,
+        "GIT_SSH_COMMAND": (
+            f"ssh -o ControlMaster=auto -o {control_path} -o ControlPersist=60s"
+        ),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Read-only helpers
 # ---------------------------------------------------------------------------
@@ -33,17 +73,47 @@ def get_branch(repo_path: Path) -> str:
     return branch or "unknown"
 
 
+# is_dirty, get_modified_count, get_ahead_behind and status_snapshot all read
+# the cached get_status_summary(), so asking for several fields of one repo
+# costs a single `git status`.
+
 def is_dirty(repo_path: Path) -> bool:
     """Return True if the working tree has uncommitted changes."""
-    result = _run(["git", "status", "--porcelain"], cwd=repo_path, check=False)
-    return bool(result.stdout.strip())
+    return get_status_summary(repo_path)["dirty"]
 
 
 def get_modified_count(repo_path: Path) -> int:
     """Return the number of modified/untracked files."""
-    result = _run(["git", "status", "--porcelain"], cwd=repo_path, check=False)
-    lines = [l for l in result.stdout.strip().splitlines() if l.strip()]
-    return len(lines)
+    return get_status_summary(repo_path)["modified_count"]
+
+
+def status_snapshot(repo_path: Path) -> tuple[str, int]:
+    """Return (branch, modified_count); a non-zero count means the tree is dirty."""
+    info = get_status_summary(repo_path)
+    return info["branch"], info["modified_count"]
+
+
+def _status_v2(repo_path: Path) -> tuple[str, int, int, int]:
+    """Return (branch, modified_count, ahead, behind) from ``git status --porcelain=v2``."""
+    # --ahead-behind overrides a user's status.aheadBehind=false, which would drop branch.ab
+    result = _run(
+        ["git", "status", "--porcelain=v2", "--branch", "--ahead-behind"], cwd=repo_path, check=False
+    )
+    branch = ""
+    modified = ahead = behind = 0
+    # Header lines start with "#"; every other line is a changed or untracked file
+    for line in result.stdout.splitlines():
+        if line.startswith("# branch.head "):
+            branch = line[len("# branch.head "):]
+        elif line.startswith("# branch.ab "):
+            # "# branch.ab +<ahead> -<behind>", only present when there is an upstream
+            plus, minus = line[len("# branch.ab "):].split()
+            ahead, behind = int(plus), -int(minus)
+        elif line and not line.startswith("#"):
+            modified += 1
+    if branch == "(detached)":
+        branch = get_branch(repo_path)
+    return branch or "unknown", modified, ahead, behind
 
 
 def get_ahead_behind(repo_path: Path) -> tuple[int, int]:
@@ -51,32 +121,46 @@ def get_ahead_behind(repo_path: Path) -> tuple[int, int]:
 
     Returns (0, 0) if there is no upstream or on error.
     """
-    result = _run(
-        ["git", "rev-list", "--left-right", "--count", "@{upstream}...HEAD"],
-        cwd=repo_path,
-        check=False,
-    )
-    if result.returncode != 0:
-        return 0, 0
-    parts = result.stdout.strip().split()
-    if len(parts) == 2:
-        behind, ahead = int(parts[0]), int(parts[1])
-        return ahead, behind
-    return 0, 0
+    info = get_status_summary(repo_path)
+    return info["ahead"], info["behind"]
 
 
 def get_status_summary(repo_path: Path) -> dict:
     """Return a combined status dict for a repo.
 
     Keys: branch, dirty, modified_count, ahead, behind
+
+    Results are cached per process, keyed on the mtimes of ``.git/HEAD`` and
+    ``.git/index`` so a checkout, commit or ``git add`` gives a fresh answer.
     """
-    branch = get_branch(repo_path)
-    dirty = is_dirty(repo_path)
-    modified = get_modified_count(repo_path)
-    ahead, behind = get_ahead_behind(repo_path)
+    git_dir = Path(repo_path) / ".git"
+    try:
+        key = ((git_dir / "HEAD").stat().st_mtime_ns, (git_dir / "index").stat().st_mtime_ns)
+    except OSError:
+        # Worktrees and fresh repos may lack these files; don't cache
+        return _status_summary.__wrapped__(str(repo_path), None)
+    return dict(_status_summary(str(repo_path), key))
+
+
+def get_status_summaries(repo_paths: list[Path]) -> list[dict]:
+    """Return get_status_summary() for each of *repo_paths*, in order.
+
+    Repos are queried concurrently; the work is almost all waiting on git.
+    """
+    if not repo_paths:
+        return []
+    workers = min(32, (os.cpu_count() or 1) * 4, len(repo_paths))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(get_status_summary, repo_paths))
+
+
+@functools.lru_cache(maxsize=128)
+def _status_summary(repo_path: str, key: Optional[tuple[int, int]]) -> dict:
+    # One `git status` gives branch, file count and ahead/behind together
+    branch, modified, ahead, behind = _status_v2(Path(repo_path))
     return {
         "branch": branch,
-        "dirty": dirty,
+        "dirty": modified > 0,
         "modified_count": modified,
         "ahead": ahead,
         "behind": behind,
@@ -87,14 +171,28 @@ def get_status_summary(repo_path: Path) -> dict:
 # Write operations
 # ---------------------------------------------------------------------------
 
-def clone(url: str, dest: Path) -> subprocess.CompletedProcess[str]:
-    """Clone a repo from *url* into *dest*."""
-    return _run(["git", "clone", url, str(dest)], cwd=dest.parent)
+def clone(
+    url: str,
+    dest: Path,
+    depth: Optional[int] = 1,
+    filter: Optional[str] = "blob:none",
+) -> subprocess.CompletedProcess[str]:
+    """Clone a repo from *url* into *dest*.
+
+    Defaults to a shallow, blobless clone of the default branch without tags;
+    pass ``depth=None, filter=None`` for a full clone.
+    """
+    args = ["git", "clone"]
+    if depth:
+        args += ["--depth", str(depth), "--no-tags", "--single-branch"]
+    if filter:
+        args.append(f"--filter={filter}")
+    return _run([*args, url, str(dest)], cwd=dest.parent, env=_remote_env())
 
 
 def pull(repo_path: Path) -> subprocess.CompletedProcess[str]:
     """Pull the latest changes."""
-    return _run(["git", "pull"], cwd=repo_path, check=False)
+    return _run(["git", "pull"], cwd=repo_path, check=False, env=_remote_env())
 
 
 def push_repo(repo_path: Path) -> subprocess.CompletedProcess[str]:
@@ -112,16 +210,36 @@ def current_branch(repo_path: Path) -> str:
 
 
 def get_default_branch(repo_path: Path) -> str:
-    """Detect the default branch (main or master)."""
-    for name in ("main", "master"):
-        result = _run(
-            ["git", "rev-parse", "--verify", name],
-            cwd=repo_path,
-            check=False,
-        )
-        if result.returncode == 0:
-            return name
-    return "main"
+    """Detect the default branch.
+
+    Reads the remote's default from ``origin/HEAD``, falling back to main or
+    master when that ref isn't set. Cached for the life of the process;
+    commands never create or rename either branch, so the answer can't
+    change under them.
+    """
+    return _default_branch(str(repo_path))
+
+
+@functools.lru_cache(maxsize=None)
+def _default_branch(repo_path: str) -> str:
+    # `git clone` records the remote's default branch here
+    result = _run(
+        ["git", "symbolic-ref", "--quiet", "--short", "refs/remotes/origin/HEAD"],
+        cwd=repo_path,
+        check=False,
+    )
+    ref = result.stdout.strip()
+    if ref.startswith("origin/"):
+        return ref[len("origin/"):]
+
+    # One for-each-ref lists whichever of the two exist, instead of a rev-parse per name
+    result = _run(
+        ["git", "for-each-ref", "--format=%(refname:short)", "refs/heads/main", "refs/heads/master"],
+        cwd=repo_path,
+        check=False,
+    )
+    existing = result.stdout.split()
+    return "master" if existing == ["master"] else "main"
 
 
 def create_branch(repo_path: Path, branch_name: str) -> subprocess.CompletedProcess[str]:
@@ -134,24 +252,48 @@ def checkout(repo_path: Path, branch_name: str) -> subprocess.CompletedProcess[s
     return _run(["git", "checkout", branch_name], cwd=repo_path, check=False)
 
 
-def has_remote_branch(repo_path: Path, branch_name: str) -> bool:
-    """Check if a branch exists on the remote."""
+def remote_branches(repo_path: Path, *, refresh: bool = False) -> set[str]:
+    """Return the names of all branches on ``origin``.
+
+    One ``git ls-remote`` per repo, cached for the life of the process so
+    checking several branches costs a single round-trip. Pass
+    ``refresh=True`` to query the remote again.
+    """
+    if refresh:
+        _remote_branches.cache_clear()
+    return set(_remote_branches(str(repo_path)))
+
+
+@functools.lru_cache(maxsize=None)
+def _remote_branches(repo_path: str) -> frozenset[str]:
     result = _run(
-        ["git", "ls-remote", "--heads", "origin", branch_name],
-        cwd=repo_path,
-        check=False,
+        ["git", "ls-remote", "--heads", "origin"], cwd=repo_path, check=False, env=_remote_env()
+    )
+    # Each line is "<sha>\trefs/heads/<branch>"
+    prefix = "refs/heads/"
+    return frozenset(
+        ref[len(prefix):]
+        for _sha, _tab, ref in (line.partition("\t") for line in result.stdout.splitlines())
+        if ref.startswith(prefix)
     )
-    return bool(result.stdout.strip())
+
+
+def has_remote_branch(repo_path: Path, branch_name: str) -> bool:
+    """Check if a branch exists on the remote."""
+    return branch_name in remote_branches(repo_path)
 
 
 def push_with_upstream(repo_path: Path) -> subprocess.CompletedProcess[str]:
     """Push the current branch with -u to set upstream tracking."""
     branch = get_branch(repo_path)
-    return _run(
+    result = _run(
         ["git", "push", "-u", "origin", branch],
         cwd=repo_path,
         check=False,
     )
+    # The push may have created the branch on the remote
+    _remote_branches.cache_clear()
+    return result
 
 
 def commits_ahead_of(repo_path: Path, base_branch: str) -> int:
@@ -2,31 +2,96 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import os
+import selectors
+import shlex
 import signal
 import subprocess
 import sys
+import tempfile
 import threading
 import time
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
-from urllib.request import urlopen
-from urllib.error import URLError
+from typing import Iterator, Optional
 
 from rich.console import Console
 
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, pids.json updates go unlocked
+    fcntl = None
+
 # Color palette for per-service log prefixes
 SERVICE_COLORS = ["cyan", "magenta", "yellow", "green", "blue", "red"]
 
 WORKBENCH_DIR = Path(".workbench")
-PID_DIR = WORKBENCH_DIR / "pids"
-
-
-def _ensure_pid_dir(root: Path) -> Path:
-    pid_dir = root / PID_DIR
-    pid_dir.mkdir(parents=True, exist_ok=True)
-    return pid_dir
+PIDS_FILE = WORKBENCH_DIR / "pids.json"
+PIDS_LOCK = WORKBENCH_DIR / "pids.lock"
+PID_DIR = WORKBENCH_DIR / "pids"  # legacy: one <name>.pid file per service
+
+
+# Characters that need a real shell to interpret (pipes, redirects, globs, expansions...)
+_SHELL_CHARS = frozenset("|&;<>()$`\\*?[]{}~#\n")
+
+
+def _command_args(command: str) -> list[str] | None:
+    """Split *command* into argv when it needs no shell, else return None.
+
+    Running simple commands directly saves a /bin/sh process per service.
+    """
+    if _SHELL_CHARS.intersection(command):
+        return None
+    try:
+        args = shlex.split(command)
+    except ValueError:
+        return None
+    # A leading VAR=value assignment is shell syntax too
+    if not args or "=" in args[0]:
+        return None
+    return args
+
+
+def _read_pids(root: Path) -> dict[str, dict]:
+    """Return the raw {name: {pid, port, started_at}} map from pids.json."""
+    try:
+        data = json.loads((root / PIDS_FILE).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+@contextlib.contextmanager
+def _pids_locked(root: Path) -> Iterator[None]:
+    """Hold an exclusive lock on pids.json for one read-modify-write.
+
+    Several `workbench up` / `down` runs may update the file at once; without
+    the lock the last os.replace() would drop the others' entries.
+    """
+    if fcntl is None:
+        yield
+        return
+    lock_path = root / PIDS_LOCK
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "ab") as lock:
+        # Released when the file is closed
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        yield
+
+
+def _write_pids(root: Path, pids: dict[str, dict]) -> None:
+    """Replace pids.json atomically; remove it when nothing is running."""
+    path = root / PIDS_FILE
+    if not pids:
+        path.unlink(missing_ok=True)
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # One encoded write; json.dump() to a text file writes chunk by chunk
+    with tempfile.NamedTemporaryFile("wb", dir=path.parent, prefix=".pids-", delete=False) as tmp:
+        tmp.write(json.dumps(pids).encode())
+    os.replace(tmp.name, path)
 
 
 class ServiceProcess:
@@ -51,42 +116,42 @@ class ServiceProcess:
         self.color = color
         self.workbench_root = workbench_root or Path.cwd()
 
-        self._env = {**os.environ, **(env or {})}
+        self._extra_env = dict(env or {})
         self._proc: subprocess.Popen | None = None
-        self._log_thread: threading.Thread | None = None
-
-    # -- PID file helpers ---------------------------------------------------
-
-    @property
-    def _pid_file(self) -> Path:
-        return _ensure_pid_dir(self.workbench_root) / f"{self.name}.pid"
-
-    def _write_pid(self) -> None:
-        self._pid_file.write_text(json.dumps({"pid": self._proc.pid, "port": self.port}))
-
-    def _remove_pid(self) -> None:
-        self._pid_file.unlink(missing_ok=True)
+        self.started_at: str | None = None
 
     # -- Lifecycle ----------------------------------------------------------
 
     def start(self) -> None:
         """Start the service subprocess."""
-        self._proc = subprocess.Popen(
-            self.command,
-            shell=True,
+        # Build the merged environment only at spawn time; with no overrides the
+        # child simply inherits ours (env=None) and nothing is copied
+        env = {**os.environ, **self._extra_env} if self._extra_env else None
+        popen_kwargs = dict(
             cwd=self.cwd,
-            env=self._env,
+            env=env,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
-            preexec_fn=os.setsid,
+            # Own process group for killpg(); unlike preexec_fn=os.setsid this
+            # keeps CPython on its vfork() spawn path
+            start_new_session=True,
         )
-        self._write_pid()
+        args = _command_args(self.command)
+        if args is None:
+            self._proc = subprocess.Popen(self.command, shell=True, **popen_kwargs)
+        else:
+            try:
+                self._proc = subprocess.Popen(args, **popen_kwargs)
+            except OSError:
+                # A missing or non-executable program: let the shell report it
+                # in the service's log, as it always has
+                self._proc = subprocess.Popen(self.command, shell=True, **popen_kwargs)
+        self.started_at = datetime.now().isoformat(timespec="seconds")
 
     def stop(self, timeout: float = 5.0) -> None:
         """Stop the service (SIGTERM then SIGKILL)."""
         if self._proc is None:
-            self._remove_pid()
             return
         try:
             os.killpg(os.getpgid(self._proc.pid), signal.SIGTERM)
@@ -98,7 +163,6 @@ class ServiceProcess:
             except (ProcessLookupError, OSError):
                 pass
         self._proc = None
-        self._remove_pid()
 
     def is_running(self) -> bool:
         if self._proc is None:
@@ -109,24 +173,32 @@ class ServiceProcess:
         """Wait for the service to become healthy.
 
         Checks the health_check URL if set, otherwise just checks the process
-        is alive after a brief delay.
+        is alive after a brief delay. Probes start 25ms apart and back off
+        to *interval*, so a fast service is noticed almost immediately.
         """
+        # urllib pulls in http.client, ssl and email; only pay for it when polling
+        from urllib.error import URLError
+        from urllib.request import urlopen
+
+        url = self.health_check
+        if url:
+            # If health_check is a relative path, build a full URL
+            if url.startswith("/") and self.port:
+                url = f"http://127.0.0.1:{self.port}{url}"
+            elif not url.startswith("http"):
+                url = f"http://127.0.0.1:{self.port}/{url.lstrip('/')}" if self.port else None
+
         deadline = time.monotonic() + timeout
+        delay = min(0.025, interval)
         while time.monotonic() < deadline:
             if not self.is_running():
                 return False
             if self.health_check:
-                url = self.health_check
-                # If health_check is a relative path, build a full URL
-                if url.startswith("/") and self.port:
-                    url = f"http://127.0.0.1:{self.port}{url}"
-                elif not url.startswith("http"):
-                    url = f"http://127.0.0.1:{self.port}/{url.lstrip('/')}" if self.port else None
                 if url:
                     try:
-                        resp = urlopen(url, timeout=2)
-                        if 200 <= resp.status < 400:
-                            return True
+                        with urlopen(url, timeout=2) as resp:
+                            if 200 <= resp.status < 400:
+                                return True
                     except (URLError, OSError, ValueError):
                         pass
             elif self.port:
@@ -141,27 +213,10 @@ class ServiceProcess:
                 # No port or health check — just wait briefly and check alive
                 time.sleep(2)
                 return self.is_running()
-            time.sleep(interval)
+            time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+            delay = min(delay * 2, interval)
         return self.is_running()
 
-    def stream_logs(self, console: Console) -> None:
-        """Stream stdout lines with a colored prefix. Run in a thread."""
-        if self._proc is None or self._proc.stdout is None:
-            return
-        tag = f"[{self.color}][{self.name:<12}][/{self.color}]"
-        try:
-            for line in self._proc.stdout:
-                console.print(f"  {tag} {line.rstrip()}")
-        except ValueError:
-            pass  # stdout closed
-
-    def start_log_thread(self, console: Console) -> None:
-        """Start a daemon thread that streams logs."""
-        self._log_thread = threading.Thread(
-            target=self.stream_logs, args=(console,), daemon=True
-        )
-        self._log_thread.start()
-
 
 class ProcessManager:
     """Manages multiple ServiceProcess instances."""
@@ -173,66 +228,157 @@ class ProcessManager:
     def add(self, svc: ServiceProcess) -> None:
         self.services[svc.name] = svc
 
-    def start_all(self, console: Console) -> dict[str, bool]:
-        """Start all registered services. Returns {name: healthy}."""
-        results: dict[str, bool] = {}
-        for name, svc in self.services.items():
-            svc.start()
-            results[name] = True  # started; health checked separately
-        return results
-
     def stop_all(self) -> None:
         for svc in self.services.values():
             svc.stop()
+        self.save_pids()
 
     def stop_service(self, name: str) -> bool:
         if name in self.services:
             self.services[name].stop()
+            self.save_pids()
             return True
         return False
 
+    def save_pids(self) -> None:
+        """Record this manager's services in pids.json with a single write.
+
+        Entries for services run by other `workbench up` invocations are kept.
+        """
+        with _pids_locked(self.root):
+            pids = _read_pids(self.root)
+            for name, svc in self.services.items():
+                if svc._proc is not None:
+                    pids[name] = {"pid": svc._proc.pid, "port": svc.port, "started_at": svc.started_at}
+                else:
+                    pids.pop(name, None)
+            _write_pids(self.root, pids)
+
     def get_running(self) -> list[str]:
         return [n for n, s in self.services.items() if s.is_running()]
 
+    def start_log_multiplexer(self, console: Console) -> threading.Thread:
+        """Stream every service's stdout from one daemon thread.
+
+        A single selector waits on all the pipes at once, replacing one
+        blocking reader thread per service.
+        """
+        thread = threading.Thread(target=self._multiplex_logs, args=(console,), daemon=True)
+        thread.start()
+        return thread
+
+    def _multiplex_logs(self, console: Console) -> None:
+        sel = selectors.DefaultSelector()
+        partial: dict[int, bytes] = {}
+        for svc in self.services.values():
+            proc = svc._proc
+            if proc is not None and proc.stdout is not None:
+                tag = f"[{svc.color}]\\[{svc.name:<12}][/{svc.color}]"
+                # Register the pipe object itself; holding it keeps the fd from
+                # being closed and reused while it is still in the selector
+                key = sel.register(proc.stdout, selectors.EVENT_READ, (svc, proc, tag))
+                partial[key.fd] = b""
+
+        def _flush(key: selectors.SelectorKey) -> None:
+            sel.unregister(key.fileobj)
+            rest = partial.pop(key.fd, b"")
+            if rest:
+                console.print(f"  {key.data[2]} {rest.decode(errors='replace').rstrip()}")
+
+        while sel.get_map():
+            # Drop pipes of services stopped or restarted since the last pass
+            for key in list(sel.get_map().values()):
+                svc, proc, _tag = key.data
+                if svc._proc is not proc or key.fileobj.closed:
+                    _flush(key)
+            if not sel.get_map():
+                break
+
+            for key, _ in sel.select(timeout=0.5):
+                fd, tag = key.fd, key.data[2]
+                chunk = b""
+                if not key.fileobj.closed:
+                    try:
+                        chunk = os.read(fd, 65536)
+                    except OSError:
+                        pass
+                if not chunk:
+                    # EOF: flush any unterminated last line and stop watching this pipe
+                    _flush(key)
+                    continue
+                *lines, partial[fd] = (partial[fd] + chunk).split(b"\n")
+                if lines:
+                    text = "\n".join(
+                        f"  {tag} {line.decode(errors='replace').rstrip()}" for line in lines
+                    )
+                    console.print(text)
+        sel.close()
+
     # -- Static helpers for checking PID files (no live manager) ------------
 
     @staticmethod
     def read_pid_files(root: Path) -> dict[str, dict]:
-        """Read all PID files and return {service_name: {pid, port}}."""
-        pid_dir = root / PID_DIR
-        if not pid_dir.exists():
-            return {}
+        """Read recorded PIDs and return {service_name: {pid, port, ...}}.
+
+        Entries whose process is gone are pruned. Legacy per-service
+        ``pids/<name>.pid`` files are still honoured.
+        """
+        pids = _read_pids(root)
         result = {}
-        for f in pid_dir.glob("*.pid"):
+        for name, data in pids.items():
             try:
-                data = json.loads(f.read_text())
-                name = f.stem
                 # Verify process is actually running
-                try:
-                    os.kill(data["pid"], 0)
-                    result[name] = data
-                except OSError:
-                    # Process not running — stale PID file
-                    f.unlink(missing_ok=True)
-            except (json.JSONDecodeError, KeyError):
-                f.unlink(missing_ok=True)
+                os.kill(data["pid"], 0)
+                result[name] = data
+            except (OSError, KeyError, TypeError):
+                pass
+        if len(result) != len(pids):
+            # Re-read under the lock so entries written meanwhile survive the prune
+            dead = {name: pids[name] for name in pids.keys() - result.keys()}
+            with _pids_locked(root):
+                current = _read_pids(root)
+                _write_pids(root, {
+                    name: data for name, data in current.items() if dead.get(name) != data
+                })
+
+        try:
+            # scandir's d_type answers is_file() without a stat per entry
+            with os.scandir(root / PID_DIR) as it:
+                legacy = [e for e in it if e.name.endswith(".pid") and e.is_file(follow_symlinks=False)]
+        except OSError:
+            legacy = []
+        for entry in legacy:
+            try:
+                with open(entry.path, "rb") as f:
+                    data = json.loads(f.read())
+                os.kill(data["pid"], 0)
+                result.setdefault(entry.name[:-len(".pid")], data)
+            except (OSError, ValueError, KeyError, TypeError):
+                # Unreadable or stale PID file
+                Path(entry.path).unlink(missing_ok=True)
         return result
 
     @staticmethod
     def kill_by_pid_file(root: Path, name: str) -> bool:
-        """Stop a service using its PID file."""
-        pid_file = root / PID_DIR / f"{name}.pid"
-        if not pid_file.exists():
-            return False
-        try:
-            data = json.loads(pid_file.read_text())
-            pid = data["pid"]
+        """Stop a service using its recorded PID."""
+        with _pids_locked(root):
+            pids = _read_pids(root)
+            data = pids.pop(name, None)
+            if data is not None:
+                _write_pids(root, pids)
+        if data is None:
+            legacy_file = root / PID_DIR / f"{name}.pid"
+            if not legacy_file.exists():
+                return False
             try:
-                os.killpg(os.getpgid(pid), signal.SIGTERM)
-            except (ProcessLookupError, OSError):
-                pass
-            pid_file.unlink(missing_ok=True)
-            return True
-        except (json.JSONDecodeError, KeyError, OSError):
-            pid_file.unlink(missing_ok=True)
+                data = json.loads(legacy_file.read_bytes())
+            except (OSError, ValueError):
+                data = {}
+            legacy_file.unlink(missing_ok=True)
+        try:
+            os.killpg(os.getpgid(data["pid"]), signal.SIGTERM)
+        except (ProcessLookupError, OSError):
+            pass
+        except (KeyError, TypeError):
             return False
+        return True